@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+VOYO Album Ledger - expand every album once, across every feeder
+=================================================================
+
+Persistent record of every album/playlist browseId the feeders have
+expanded with get_album: the track IDs it held and when. The same
+albums come back from artist pages, album searches and graph crawls in
+every run; once an album is in the ledger it is skipped until it is
+`refresh_days` old, then expanded again to pick up added tracks.
+
+- SQLite file under STATE_DIR, shared by concurrent feeders (WAL)
+- Track IDs kept per album, so coverage can be checked without YTMusic
+- Release watermarks per artist browseId: the newest single/album seen on
+  the artist page, so a refresh only expands what came out since
+
+Usage:
+    ledger = AlbumLedger()
+    if not ledger.fresh(browse_id):
+        album = ytm.get_album(browse_id)
+        ledger.record(browse_id, [t['videoId'] for t in album['tracks']])
+"""
+
+import json
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from feeder_state import STATE_DIR
+
+LEDGER_PATH = STATE_DIR / 'album_ledger.sqlite'
+REFRESH_DAYS = 90
+
+class AlbumLedger:
+    def __init__(self, path: Path = LEDGER_PATH, refresh_days: float = REFRESH_DAYS):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_age = refresh_days * 86400
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.execute('''CREATE TABLE IF NOT EXISTS albums (
+            browse_id TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            track_ids TEXT NOT NULL,
+            track_count INTEGER NOT NULL,
+            expanded REAL NOT NULL
+        )''')
+        self.db.execute('''CREATE TABLE IF NOT EXISTS artists (
+            browse_id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            newest TEXT NOT NULL,
+            checked REAL NOT NULL
+        )''')
+
+    @staticmethod
+    def kind(browse_id: str) -> str:
+        return 'album' if browse_id.startswith('MPRE') else 'playlist'
+
+    def fresh(self, browse_id: str) -> bool:
+        """Expanded recently enough to skip"""
+        with self.lock:
+            row = self.db.execute('SELECT expanded FROM albums WHERE browse_id = ?',
+                                  (browse_id,)).fetchone()
+        return row is not None and time.time() - row[0] < self.max_age
+
+    def get(self, browse_id: str) -> Optional[Dict]:
+        with self.lock:
+            row = self.db.execute('SELECT kind, track_ids, expanded FROM albums WHERE browse_id = ?',
+                                  (browse_id,)).fetchone()
+        if row is None:
+            return None
+        return {'kind': row[0], 'track_ids': row[1].split(',') if row[1] else [], 'expanded': row[2]}
+
+    def record(self, browse_id: str, track_ids: List[str]):
+        with self.lock:
+            self.db.execute('INSERT OR REPLACE INTO albums VALUES (?, ?, ?, ?, ?)',
+                            (browse_id, self.kind(browse_id), ','.join(track_ids),
+                             len(track_ids), time.time()))
+
+    # ---------- artist release watermarks ----------
+
+    def watermark(self, artist_id: str) -> Dict[str, str]:
+        """Newest release browseId per artist page section ('albums', 'singles')"""
+        with self.lock:
+            row = self.db.execute('SELECT newest FROM artists WHERE browse_id = ?',
+                                  (artist_id,)).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def watch(self, artist_id: str, name: str, newest: Dict[str, str]):
+        """Record the artist's newest releases as of now (sections not given are kept)"""
+        with self.lock:
+            row = self.db.execute('SELECT newest FROM artists WHERE browse_id = ?',
+                                  (artist_id,)).fetchone()
+            marks = dict(json.loads(row[0]) if row else {}, **newest)
+            self.db.execute('INSERT OR REPLACE INTO artists VALUES (?, ?, ?, ?)',
+                            (artist_id, name, json.dumps(marks), time.time()))
+
+    def artists(self, checked_before: Optional[float] = None) -> List[Tuple[str, str]]:
+        """(browse_id, name) of watched artists, least recently checked first"""
+        with self.lock:
+            return self.db.execute(
+                'SELECT browse_id, name FROM artists WHERE checked < ? ORDER BY checked',
+                (checked_before if checked_before is not None else time.time(),)).fetchall()
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.db.execute('SELECT COUNT(*) FROM albums').fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.db.close()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+VOYO ARTIST GRAPH FEEDER - Built by DASH & ZION
+================================================
+
+FROM THE ARTISTS WE KNOW TO THE ONES NOBODY TYPED.
+
+Seeds from every artist in ULTIMATE_DOMAINS and ALL_ARTISTS, then walks
+YTMusic's related-artist graph wave by wave. Each wave visits the
+frontier artists most likely to be missing from the catalog: their
+top songs, albums and singles go to Supabase, their related artists
+join the frontier.
+
+The graph lives in .feeder-state/artist_graph.json: stop any time,
+run again to continue (--reset starts over). With --shard i/N each shard
+keeps artist_graph_iofN.json and hands the related artists that belong
+to the other shards over through artist_graph_handoff_iofN.json; shards
+on other hosts are reconciled with `merge_shards.py graph`.
+
+Usage:
+    python3 scripts/artist-graph-feeder.py [waves] [--workers 6] [--wave 200] [--max-albums 5] [--reset] [--shard i/N] [--rate 8]
+"""
+
+import time
+import argparse
+
+from feeder_engine import FeederEngine, get_db_count, add_engine_args, engine_options
+from feeder_state import read_constant, load_json, save_json
+from artist_graph import ArtistGraph, STATE_FILE, HANDOFF_FILE
+from catalog_coverage import catalog_artist_counts
+from sync_tiers_to_supabase import normalize_name
+
+def seed_artists():
+    """Every hand-typed artist the other feeders search for"""
+    names = []
+    for config in read_constant('ultimate-feeder.py', 'ULTIMATE_DOMAINS', {}).values():
+        names.extend(config.get('artists', []))
+    names.extend(read_constant('autonomous-beast.py', 'ALL_ARTISTS', []))
+    return list(dict.fromkeys(names))
+
+def adopt_handoffs(graph: ArtistGraph, shard) -> int:
+    """Fold in the artists the sibling shards found for this one"""
+    index, total = shard
+    return sum(graph.merge(load_json(HANDOFF_FILE.format(j, total), {}).get('nodes', {}))
+               for j in range(total) if j != index)
+
+# ============================================
+# RUN
+# ============================================
+
+def run_graph(waves: int = 0, workers: int = 6, wave_size: int = 200, max_albums: int = 5,
+              reset: bool = False, catalog_max_age: float = 24, **engine_opts):
+    """Crawl `waves` waves (0 = until the frontier is empty)"""
+    print("=" * 70)
+    print("  🕸️  VOYO ARTIST GRAPH FEEDER - Built by DASH & ZION 🕸️")
+    print("  FROM THE ARTISTS WE KNOW TO THE ONES NOBODY TYPED.")
+    print("=" * 70)
+
+    # Shards sharing a machine keep separate graphs
+    shard = engine_opts.get('shard')
+    graph = ArtistGraph(f'artist_graph_{shard[0]}of{shard[1]}.json' if shard else STATE_FILE)
+    if reset:
+        graph.nodes, graph.aliases = {}, {}
+    seeded = graph.seed(seed_artists())
+    summary = graph.summary()
+    print(f"  🌱 Seeds added: {seeded:,} | Graph: {summary['nodes']:,} artists, "
+          f"{summary['visited']:,} visited, {summary['frontier']:,} in frontier")
+
+    start_time = time.time()
+    initial_count = get_db_count()
+    print(f"  📊 Initial database count: {initial_count:,} tracks")
+
+    # Novelty from one cached catalog scan (credits split), not a count per artist
+    try:
+        counts = catalog_artist_counts(catalog_max_age)
+    except Exception as e:
+        print(f"  ⚠️ Catalog artist counts unavailable ({e}): novelty unknown for every artist")
+        counts = None
+
+    def count_tracks(name: str) -> int:
+        return counts.get(normalize_name(name), 0)
+
+    engine = FeederEngine(concurrency=workers, on_task=graph.record,
+                          on_error=graph.fail, **engine_opts)
+    wave = 0
+    try:
+        while not waves or wave < waves:
+            if shard:
+                adopted = adopt_handoffs(graph, shard)
+                if adopted:
+                    print(f"  🤝 {adopted:,} artists handed over by other shards")
+            keys = graph.next_wave(wave_size, count_tracks=count_tracks if counts is not None else None,
+                                   keep=engine.in_shard)
+            if not keys:
+                print("  🏁 Frontier exhausted")
+                break
+            wave += 1
+            graph.visited_now = graph.added_now = 0
+            print(f"\n  🌊 WAVE {wave}: {len(keys)} artists "
+                  f"(e.g. {', '.join(graph.nodes[k]['name'] for k in keys[:3])})")
+            engine.run([graph.source(keys, max_albums=max_albums)])
+            graph.save()
+            if shard:
+                save_json(HANDOFF_FILE.format(*shard), {'nodes': graph.handoff(engine.in_shard)})
+            summary = graph.summary()
+            print(f"  🕸️  Visited {graph.visited_now:,}, +{graph.added_now:,} new artists | "
+                  f"frontier {summary['frontier']:,} ({summary['failed']:,} failed), "
+                  f"depth {summary['max_depth']}")
+    except KeyboardInterrupt:
+        print("\n  ⚠️ Interrupted - graph saved, run again to resume")
+    finally:
+        graph.save()
+
+    elapsed = time.time() - start_time
+    summary = graph.summary()
+
+    print()
+    print("=" * 70)
+    print("  🕸️  GRAPH RESULTS 🕸️")
+    print("=" * 70)
+    print(f"  Waves:             {wave}")
+    print(f"  Artists visited:   {summary['visited']:,} / {summary['nodes']:,}")
+    print(f"  NEW TRACKS:        +{engine.total_inserted:,}")
+    print(f"  Time elapsed:      {elapsed:.1f}s ({elapsed/60:.1f} min)")
+    print("=" * 70)
+    print("  🔥 Built by DASH & ZION 🔥")
+    print("=" * 70)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='VOYO Artist Graph Feeder')
+    parser.add_argument('waves', type=int, nargs='?', default=0, help='Waves to crawl (0 = until done)')
+    parser.add_argument('--workers', type=int, default=6, help='Concurrent artist visits')
+    parser.add_argument('--wave', type=int, default=200, help='Frontier artists per wave')
+    parser.add_argument('--max-albums', type=int, default=5, help='Albums/singles expanded per artist')
+    parser.add_argument('--reset', action='store_true', help='Discard the saved graph and start over')
+    add_engine_args(parser)
+    args = parser.parse_args()
+    run_graph(waves=args.waves, workers=args.workers, wave_size=args.wave,
+              max_albums=args.max_albums, reset=args.reset,
+              catalog_max_age=args.catalog_max_age, **engine_options(args))
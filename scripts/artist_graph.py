@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+VOYO Artist Graph - reach the long tail without typing names
+=============================================================
+
+Crawls YTMusic's related-artist graph outward from the hand-typed seed
+lists. Every visited artist page yields its songs and releases (through
+the engine) plus its related artists, which join a persistent frontier.
+
+Frontier priority estimates how much is still missing:
+- novelty: artists with few tracks in the catalog score higher
+  (unknown until checked, so never-seen artists start at the top)
+- parent yield: neighbours of artists that produced new tracks first
+
+The graph is saved after every wave, so a crawl resumes where it stopped.
+
+Sharded crawls: each shard only visits the artists that hash to it, and
+hands the related artists it found for the others over through handoff()
+files; merge() folds another shard's nodes (or whole graph) in.
+
+Usage:
+    graph = ArtistGraph()
+    graph.seed(names)
+    engine = FeederEngine(on_task=graph.record, on_error=graph.fail)
+    engine.run([graph.source(graph.next_wave(200))])
+    graph.save()
+"""
+
+import time
+import heapq
+from typing import Callable, Dict, Iterator, List, Optional
+
+from feeder_state import load_json, save_json
+from feeder_engine import Task, Source
+
+STATE_FILE = 'artist_graph.json'
+HANDOFF_FILE = 'artist_graph_handoff_{}of{}.json'   # shard i's finds for the other shards
+
+SEED_YIELD = 0.5        # assumed yield of a seed's parent
+NOVELTY_HALF = 10       # catalog tracks at which novelty drops to 0.5
+PREFETCH = 3            # catalog counts checked per frontier slot in a wave
+RETRY_DAYS = 30         # an artist tried without getting a page sits out this long
+
+class ArtistGraph:
+    def __init__(self, state_file: str = STATE_FILE):
+        self.state_file = state_file
+        state = load_json(state_file, {})
+        # key -> {name, query, depth, refs, parent_yield, catalog, visited, failed, yield}
+        self.nodes: Dict[str, Dict] = state.get('nodes', {})
+        # name-seed key -> resolved channel browseId
+        self.aliases: Dict[str, str] = state.get('aliases', {})
+        self.children: Dict[str, List[str]] = {}
+        self.visited_now = 0
+        self.added_now = 0
+
+    @staticmethod
+    def key(query: str) -> str:
+        """Channel browseIds key themselves; seeds by name until resolved"""
+        return query if query.startswith('UC') else f'name:{query.strip().lower()}'
+
+    # ---------- growing ----------
+
+    def seed(self, names: List[str]) -> int:
+        added = 0
+        for name in names:
+            key = self.key(name)
+            if key in self.nodes or key in self.aliases:
+                continue
+            self.nodes[key] = {'name': name, 'query': name, 'depth': 0, 'refs': 0,
+                               'parent_yield': SEED_YIELD}
+            added += 1
+        return added
+
+    def visit(self, task: Task, page: Dict):
+        """Task.visit hook: mark the artist done and queue its related artists"""
+        key = self.key(task.query)
+        node = self.nodes.setdefault(key, {'name': task.query, 'query': task.query,
+                                           'depth': 0, 'refs': 0, 'parent_yield': SEED_YIELD})
+        node['visited'] = time.time()
+        node['name'] = page.get('name') or node['name']
+        self.visited_now += 1
+
+        channel = page.get('channelId')
+        if channel and channel != key:
+            # Seeded by name: the artist is also known (and done) by its channel,
+            # so a related list naming it doesn't queue it again
+            self.aliases[key] = channel
+            twin = self.nodes.setdefault(channel, {'name': node['name'], 'query': channel,
+                                                   'depth': node['depth'], 'refs': 0,
+                                                   'parent_yield': node['parent_yield']})
+            twin['visited'] = node['visited']
+
+        aliased = set(self.aliases.values())
+        children = []
+        for rel in (page.get('related') or {}).get('results', []):
+            bid = rel.get('browseId')
+            if not bid or not bid.startswith('UC') or bid in aliased:
+                continue
+            child = self.nodes.get(bid)
+            if child is None:
+                child = self.nodes[bid] = {'name': rel.get('title') or bid, 'query': bid,
+                                           'depth': node['depth'] + 1, 'refs': 0,
+                                           'parent_yield': 0.0}
+                self.added_now += 1
+            child['refs'] += 1
+            child['depth'] = min(child['depth'], node['depth'] + 1)
+            children.append(bid)
+        self.children[key] = children
+
+    def record(self, task: Task, returned: int, new: int):
+        """FeederEngine on_task hook: pass the artist's yield on to its neighbours.
+
+        An artist whose search found no page never reached visit(): it
+        leaves the frontier as failed instead of topping every wave.
+        """
+        key = self.key(task.query)
+        node = self.nodes.get(key)
+        if node is None:
+            return
+        if not node.get('visited'):
+            node['failed'] = time.time()
+            return
+        y = new / returned if returned else 0.0
+        node['yield'] = y
+        for child in self.children.pop(key, []):
+            c = self.nodes[child]
+            c['parent_yield'] = max(c['parent_yield'], y)
+
+    def fail(self, task: Task, error: Exception):
+        """FeederEngine on_error hook: an artist task that raised leaves the frontier"""
+        node = self.nodes.get(self.key(task.query))
+        if node is not None and not node.get('visited'):
+            node['failed'] = time.time()
+        self.children.pop(self.key(task.query), None)
+
+    # ---------- planning ----------
+
+    @staticmethod
+    def priority(node: Dict) -> float:
+        catalog = node.get('catalog')
+        novelty = 1.0 if catalog is None else NOVELTY_HALF / (NOVELTY_HALF + catalog)
+        return novelty * (0.5 + node['parent_yield'])
+
+    def frontier(self) -> List[str]:
+        """Unvisited artists; failed ones come back after RETRY_DAYS"""
+        retry = time.time() - RETRY_DAYS * 86400
+        return [k for k, n in self.nodes.items()
+                if not n.get('visited') and n.get('failed', 0) < retry and k not in self.aliases]
+
+    def next_wave(self, n: int, count_tracks: Optional[Callable[[str], int]] = None,
+                  keep: Optional[Callable[[str], bool]] = None) -> List[str]:
+        """Top-`n` frontier keys; catalog counts are looked up for the leading candidates.
+
+        `count_tracks(name)` should be a cheap lookup (catalog_artist_counts);
+        `keep(query)` restricts the wave (e.g. FeederEngine.in_shard).
+        """
+        frontier = self.frontier()
+        if keep is not None:
+            frontier = [k for k in frontier if keep(self.nodes[k]['query'])]
+        candidates = heapq.nlargest(n * PREFETCH, frontier,
+                                    key=lambda k: self.priority(self.nodes[k]))
+        if count_tracks is not None:
+            for k in candidates:
+                if self.nodes[k].get('catalog') is None:
+                    self.nodes[k]['catalog'] = count_tracks(self.nodes[k]['name'])
+        return heapq.nlargest(n, candidates, key=lambda k: self.priority(self.nodes[k]))
+
+    def source(self, keys: List[str], max_albums: int = 5, tag: str = 'graph') -> 'GraphSource':
+        return GraphSource(self, keys, max_albums, tag)
+
+    # ---------- shards ----------
+
+    def handoff(self, keep: Callable[[str], bool]) -> Dict[str, Dict]:
+        """Frontier artists this shard found but `keep` leaves to another shard"""
+        return {k: self.nodes[k] for k in self.frontier() if not keep(self.nodes[k]['query'])}
+
+    def merge(self, nodes: Dict[str, Dict], aliases: Optional[Dict[str, str]] = None) -> int:
+        """Fold another graph's nodes in; returns how many artists were new.
+
+        Visited and failed times keep the latest, depth the shallowest,
+        refs and parent yield the highest; known catalog counts are kept.
+        """
+        added = 0
+        for key, other in nodes.items():
+            node = self.nodes.get(key)
+            if node is None:
+                self.nodes[key] = dict(other)
+                added += 1
+                continue
+            for f in ('visited', 'failed'):
+                if other.get(f, 0) > node.get(f, 0):
+                    node[f] = other[f]
+            node['depth'] = min(node['depth'], other['depth'])
+            node['refs'] = max(node['refs'], other['refs'])
+            node['parent_yield'] = max(node['parent_yield'], other['parent_yield'])
+            for f in ('catalog', 'yield'):
+                if node.get(f) is None and other.get(f) is not None:
+                    node[f] = other[f]
+        for key, channel in (aliases or {}).items():
+            self.aliases.setdefault(key, channel)
+        return added
+
+    # ---------- state ----------
+
+    def save(self):
+        save_json(self.state_file, {'nodes': self.nodes, 'aliases': self.aliases})
+
+    def summary(self) -> Dict[str, int]:
+        # A name seed and its channel are one artist: count the channel
+        artists = [n for k, n in self.nodes.items() if k not in self.aliases]
+        visited = sum(1 for n in artists if n.get('visited'))
+        return {
+            'nodes': len(artists),
+            'visited': visited,
+            'frontier': len(self.frontier()),
+            'failed': sum(1 for n in self.nodes.values() if n.get('failed') and not n.get('visited')),
+            'max_depth': max((n['depth'] for n in self.nodes.values() if n.get('visited')), default=0),
+        }
+
+class GraphSource(Source):
+    """One wave of frontier artists, visited through the engine's `artist` task"""
+
+    def __init__(self, graph: ArtistGraph, keys: List[str], max_albums: int, tag: str):
+        self.graph = graph
+        self.keys = keys
+        self.max_albums = max_albums
+        self.tag = tag
+
+    def tasks(self) -> Iterator[Task]:
+        for key in self.keys:
+            yield Task('artist', self.graph.nodes[key]['query'], 'artists', 1, self.tag,
+                       max_albums=self.max_albums, visit=self.graph.visit)
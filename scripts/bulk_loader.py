@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+VOYO Bulk Loader - upload the NDJSON track spool in large chunks
+=================================================================
+
+Second half of --spool-only feeding (see track_spool.py):
+
+- Stage: every rotated spool file is folded into a local SQLite staging
+  table keyed by youtube_id. Duplicates are merged (later non-null values
+  win), and the file moves to tracks/loaded/.
+- Load: staged rows are sent through ingest_tracks (the same spooled,
+  retried, dead-lettered path the feeders use), LOAD_CHUNK rows per call,
+  with progress and inserted/merged counts.
+
+The upload cursor is saved after every chunk, so an interrupted load
+continues where it stopped. `--replay` stages the already loaded files
+again, e.g. after a database restore.
+
+Usage:
+    python3 scripts/bulk_loader.py load [--chunk 2000] [--replay]
+    python3 scripts/bulk_loader.py status
+"""
+
+import os
+import json
+import time
+import sqlite3
+import argparse
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+from feeder_state import STATE_DIR
+from track_spool import TRACK_SPOOL_DIR, TrackSpool, closed_files, read_spool
+
+STAGING_PATH = STATE_DIR / 'bulk_load.sqlite'
+LOADED_DIR = TRACK_SPOOL_DIR / 'loaded'
+LOAD_CHUNK = 2000
+STAGE_COMMIT = 10_000
+
+class Staging:
+    """youtube_id -> merged row, plus the upload cursor (rowid of the last sent row)"""
+
+    def __init__(self, path: Path = STAGING_PATH):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(path), isolation_level=None)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.execute('''CREATE TABLE IF NOT EXISTS staging (
+            youtube_id TEXT PRIMARY KEY,
+            row TEXT NOT NULL
+        )''')
+        self.db.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+
+    @property
+    def cursor(self) -> int:
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'cursor'").fetchone()
+        return int(row[0]) if row else 0
+
+    @cursor.setter
+    def cursor(self, rowid: int):
+        self.db.execute("INSERT OR REPLACE INTO meta VALUES ('cursor', ?)", (str(rowid),))
+
+    def stage(self, rows: Iterator[Dict]) -> int:
+        """Merge rows in; a re-staged id gets a new rowid so it is sent again"""
+        n = 0
+        self.db.execute('BEGIN')
+        for row in rows:
+            vid = row.get('youtube_id')
+            if not vid:
+                continue
+            patch = json.dumps({k: v for k, v in row.items() if v is not None})
+            self.db.execute('''INSERT OR REPLACE INTO staging (youtube_id, row) VALUES (?,
+                json_patch(COALESCE((SELECT row FROM staging WHERE youtube_id = ?), '{}'), ?))''',
+                            (vid, vid, patch))
+            n += 1
+            if n % STAGE_COMMIT == 0:
+                self.db.execute('COMMIT')
+                self.db.execute('BEGIN')
+        self.db.execute('COMMIT')
+        return n
+
+    def pending(self) -> int:
+        return self.db.execute('SELECT COUNT(*) FROM staging WHERE rowid > ?',
+                               (self.cursor,)).fetchone()[0]
+
+    def chunks(self, size: int) -> Iterator[List]:
+        """(rowid, row) chunks after the cursor, in staging order"""
+        last = self.cursor
+        while True:
+            batch = self.db.execute('SELECT rowid, row FROM staging WHERE rowid > ? '
+                                    'ORDER BY rowid LIMIT ?', (last, size)).fetchall()
+            if not batch:
+                return
+            last = batch[-1][0]
+            yield batch
+
+    def clear(self):
+        """Everything staged has been sent: start the next load empty"""
+        self.db.execute('DELETE FROM staging')
+        self.db.execute('DELETE FROM meta')
+
+    def close(self):
+        self.db.close()
+
+# ============================================
+# STAGE & LOAD
+# ============================================
+
+def stage_files(staging: Staging, replay: bool = False) -> int:
+    """Fold rotated spool files into staging, moving each to loaded/"""
+    LOADED_DIR.mkdir(parents=True, exist_ok=True)
+    recovered = TrackSpool().recover()
+    if recovered:
+        print(f"  ♻️  Closed {recovered} spool files left open by dead feeders")
+    if replay:
+        for path in closed_files(LOADED_DIR):
+            os.replace(path, TRACK_SPOOL_DIR / path.name)
+    staged = 0
+    for path in closed_files():
+        n = staging.stage(read_spool(path))
+        os.replace(path, LOADED_DIR / path.name)
+        print(f"  📥 {path.name}: {n:,} rows")
+        staged += n
+    return staged
+
+def load(chunk: int = LOAD_CHUNK, replay: bool = False):
+    from feeder_engine import spool, INGESTED
+
+    staging = Staging()
+    staged = stage_files(staging, replay)
+    total = staging.pending()
+    print(f"  🗃️  Staged {staged:,} spooled rows | {total:,} unique tracks to upload")
+    if not total:
+        staging.close()
+        return
+
+    s = spool()
+    ingested = dict(INGESTED)
+    sent = synced = 0
+    start = time.time()
+    for batch in staging.chunks(chunk):
+        synced += s.submit([json.loads(row) for _, row in batch])
+        staging.cursor = batch[-1][0]
+        sent += len(batch)
+        elapsed = max(time.time() - start, 1e-6)
+        new = (INGESTED['inserted'] - ingested['inserted']
+               + INGESTED['unclassified'] - ingested['unclassified'])
+        print(f"  📤 {sent:,}/{total:,} ({sent / total:.0%}) | {sent / elapsed:,.0f} rows/s | "
+              f"+{new:,} new, {INGESTED['updated'] - ingested['updated']:,} merged")
+
+    staging.clear()
+    staging.close()
+    print(f"✅ Loaded {synced:,} of {total:,} tracks in {time.time() - start:.0f}s"
+          + (f" ({s.dead} chunks dead-lettered: python3 scripts/upload_spool.py replay)"
+             if s.dead else ''))
+
+def status():
+    staging = Staging()
+    parts = list(TRACK_SPOOL_DIR.glob('*.ndjson.gz.part'))
+    print(f"Spool: {len(closed_files())} files ready, {len(parts)} open | "
+          f"Staged: {staging.pending():,} tracks not yet uploaded | "
+          f"Loaded files kept: {len(closed_files(LOADED_DIR))}")
+    staging.close()
+
+# ============================================
+# MAIN
+# ============================================
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='VOYO Bulk Loader')
+    parser.add_argument('command', choices=['load', 'status'])
+    parser.add_argument('--chunk', type=int, default=LOAD_CHUNK,
+                        help=f'Rows per ingest call (default {LOAD_CHUNK})')
+    parser.add_argument('--replay', action='store_true',
+                        help='Stage and upload already loaded spool files again')
+    args = parser.parse_args()
+
+    if args.command == 'load':
+        load(args.chunk, args.replay)
+    else:
+        status()
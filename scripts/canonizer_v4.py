@@ -35,6 +35,8 @@ import urllib.request
 import urllib.error
 import urllib.parse
 
+from supabase_client import get_client
+
 # ============================================
 # CONFIGURATION
 # ============================================
@@ -338,41 +340,31 @@ def detect_cultural_tags(text: str) -> List[str]:
 # SUPABASE OPERATIONS
 # ============================================
 
+def music_only(db) -> Dict[str, str]:
+    """Filter out tracks tagged non-music at ingest and re-uploads linked to a
+    canonical track (each a no-op before its migration, 005 / 004)"""
+    filters = {}
+    if db.has_column('video_intelligence', 'non_music'):
+        filters['non_music'] = 'is.null'
+    if db.has_column('video_intelligence', 'canonical_id'):
+        filters['canonical_id'] = 'is.null'
+    return filters
+
 def fetch_tracks_from_supabase(offset: int = 0, limit: int = 1000) -> List[Dict]:
     """Fetch tracks from Supabase with pagination."""
-    url = f"{SUPABASE_URL}/rest/v1/video_intelligence?select=*&offset={offset}&limit={limit}"
-
-    headers = {
-        'apikey': SUPABASE_KEY,
-        'Authorization': f'Bearer {SUPABASE_KEY}',
-        'Content-Type': 'application/json'
-    }
-
-    req = urllib.request.Request(url, headers=headers)
     try:
-        with urllib.request.urlopen(req, timeout=30) as response:
-            return json.loads(response.read().decode())
+        db = get_client(SUPABASE_URL, SUPABASE_KEY)
+        return db.select('video_intelligence', {'select': '*', **music_only(db),
+                                                'offset': offset, 'limit': limit})
     except Exception as e:
         print(f"Error fetching from Supabase: {e}")
         return []
 
 def get_total_track_count() -> int:
     """Get total count of tracks in Supabase."""
-    url = f"{SUPABASE_URL}/rest/v1/video_intelligence?select=count"
-
-    headers = {
-        'apikey': SUPABASE_KEY,
-        'Authorization': f'Bearer {SUPABASE_KEY}',
-        'Content-Type': 'application/json',
-        'Prefer': 'count=exact'
-    }
-
-    req = urllib.request.Request(url, headers=headers, method='HEAD')
     try:
-        with urllib.request.urlopen(req, timeout=30) as response:
-            count_range = response.headers.get('Content-Range', '*/0')
-            total = int(count_range.split('/')[-1])
-            return total
+        db = get_client(SUPABASE_URL, SUPABASE_KEY)
+        return db.count('video_intelligence', music_only(db))
     except Exception as e:
         print(f"Error getting count: {e}")
         return 0
@@ -407,7 +399,10 @@ def query_musicbrainz(artist_name: str) -> Optional[Dict]:
 # ============================================
 
 def get_youtube_views(video_id: str) -> Optional[int]:
-    """Get view count from YouTube Data API."""
+    """Get view count from YouTube Data API.
+
+    Feeders now store view_count at ingest; only needed for older rows.
+    """
     if not YOUTUBE_API_KEY:
         return None
 
@@ -596,11 +591,12 @@ def classify_with_patterns(track: Dict) -> CanonScore:
         else:
             canon_level = 'ECHO'
 
-    # Detect era
-    release_year = None
-    year_match = re.search(r'\b(19[5-9]\d|20[0-2]\d)\b', f"{title} {channel}")
-    if year_match:
-        release_year = int(year_match.group())
+    # Detect era (year captured by the feeders at ingest, else guessed from the title)
+    release_year = track.get('year')
+    if not release_year:
+        year_match = re.search(r'\b(19[5-9]\d|20[0-2]\d)\b', f"{title} {channel}")
+        if year_match:
+            release_year = int(year_match.group())
     era = detect_era(release_year)
 
     # Compute accessibility
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+VOYO Catalog Coverage - spend the API budget where the catalog is thin
+=======================================================================
+
+Joins the artist registry (data/artists_*_complete.json, tiers A/B/C)
+against how many catalog tracks credit each normalized artist, and turns
+the gap into a crawl priority and an effort budget per artist:
+
+- Target tracks per tier (A 300, B 120, C 40); need = 1 - have/target
+- Budget scales with need: song search depth, video search (skipped for
+  well-covered artists) and albums expanded
+- Tasks for artists the catalog is missing run first
+
+Feeders pass --coverage to reorder and resize their artist tasks with it;
+this script also prints the report and can crawl the registry by gap.
+
+Usage:
+    python3 scripts/catalog_coverage.py [--top 40] [--refresh]
+    python3 scripts/catalog_coverage.py --run [workers] [--resume] [--shard i/N] [--rate 8]
+"""
+
+import re
+import time
+import argparse
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional
+
+from feeder_state import load_json, save_json
+from sync_tiers_to_supabase import load_artist_tiers, normalize_name
+from feeder_engine import (
+    Task, Source, FeederEngine, catalog_rows, get_db_count, add_engine_args, engine_options
+)
+
+COUNTS_FILE = 'coverage_counts.json'
+TIER_TARGETS = {'A': 300, 'B': 120, 'C': 40}
+NEUTRAL = 0.5           # priority of tasks that aren't about a known artist
+
+SONGS_MIN, SONGS_MAX = 10, 100
+VIDEOS_FROM = 0.25      # need below which video searches are skipped
+VIDEOS_MIN, VIDEOS_MAX = 15, 50
+ALBUMS_MAX = 10
+
+# "Burna Boy, Stormzy" / "Rema & Selena Gomez" / "X feat. Y": one credit each
+CREDIT_SPLIT = re.compile(r'\s*(?:,|&|\bx\b|\bfeat\.?|\bft\.?|\bwith\b)\s*', re.I)
+
+def catalog_artist_counts(max_age_hours: float = 24, refresh: bool = False) -> Dict[str, int]:
+    """Catalog tracks per normalized credited artist (cached in the feeder state)"""
+    cached = load_json(COUNTS_FILE, {})
+    if cached.get('taken_at') and not refresh:
+        age = datetime.now(timezone.utc) - datetime.fromisoformat(cached['taken_at'])
+        if age.total_seconds() < max_age_hours * 3600:
+            return cached['counts']
+    start = time.time()
+    counts: Dict[str, int] = {}
+    rows = 0
+    for row in catalog_rows('youtube_id,artist'):
+        rows += 1
+        for credit in CREDIT_SPLIT.split(row.get('artist') or ''):
+            norm = normalize_name(credit)
+            if norm:
+                counts[norm] = counts.get(norm, 0) + 1
+    save_json(COUNTS_FILE, {'taken_at': datetime.now(timezone.utc).isoformat(), 'counts': counts})
+    print(f"  📚 Coverage: {rows:,} catalog tracks, {len(counts):,} credited artists "
+          f"({time.time() - start:.1f}s)")
+    return counts
+
+class Coverage:
+    """Registry artists with their catalog gap; `apply()` is the FeederEngine hook"""
+
+    def __init__(self, counts: Dict[str, int], registry: Optional[Dict[str, Dict]] = None):
+        self.counts = counts
+        self.registry = registry if registry is not None else load_artist_tiers()
+        self.skipped = 0
+
+    @classmethod
+    def load(cls, max_age_hours: float = 24, refresh: bool = False) -> 'Coverage':
+        return cls(catalog_artist_counts(max_age_hours, refresh))
+
+    # ---------- gaps ----------
+
+    def have(self, norm: str) -> int:
+        return self.counts.get(norm, 0) or self.counts.get(norm.replace(' ', ''), 0)
+
+    def need(self, query: str) -> Optional[float]:
+        """0 (covered) .. 1 (missing); None if `query` isn't a known artist"""
+        norm = normalize_name(query)
+        entry = self.registry.get(norm)
+        have = self.have(norm)
+        if entry is None and not have:
+            return None
+        target = TIER_TARGETS.get(entry['tier'] if entry else 'C', TIER_TARGETS['C'])
+        return 1.0 - min(1.0, have / target)
+
+    @staticmethod
+    def budget(need: float) -> Dict[str, int]:
+        return {
+            'songs': round(SONGS_MIN + (SONGS_MAX - SONGS_MIN) * need),
+            'videos': round(VIDEOS_MIN + (VIDEOS_MAX - VIDEOS_MIN) * need) if need >= VIDEOS_FROM else 0,
+            'albums': round(ALBUMS_MAX * need),
+        }
+
+    def report(self) -> List[Dict]:
+        """One row per registry artist, thinnest first"""
+        rows, seen = [], set()
+        for norm, entry in self.registry.items():
+            if entry['name'] in seen:
+                continue        # no-space alias of an artist already listed
+            seen.add(entry['name'])
+            target = TIER_TARGETS.get(entry['tier'], TIER_TARGETS['C'])
+            have = self.have(norm)
+            rows.append({'name': entry['name'], 'tier': entry['tier'], 'country': entry['country'],
+                         'have': have, 'target': target,
+                         'need': 1.0 - min(1.0, have / target)})
+        rows.sort(key=lambda r: (-r['need'], r['tier'], r['name']))
+        return rows
+
+    # ---------- feeder hook ----------
+
+    def apply(self, tasks: List[Task]) -> List[Task]:
+        """Resize artist tasks to their budget and put the thinnest artists first.
+
+        Song searches get the budgeted depth, video searches and album crawls
+        of well-covered artists are dropped or trimmed. Tasks that aren't
+        about a known artist keep their limits and a middle priority.
+        """
+        planned = []
+        for task in tasks:
+            need = self.need(task.query)
+            if need is None:
+                planned.append((NEUTRAL, task))
+                continue
+            budget = self.budget(need)
+            if task.kind == 'search' and task.filter == 'songs':
+                task.limit = budget['songs']
+            elif task.kind == 'search' and task.filter == 'videos':
+                if not budget['videos']:
+                    self.skipped += 1
+                    continue
+                task.limit = budget['videos']
+            elif task.kind == 'album_search':
+                if not budget['albums']:
+                    self.skipped += 1
+                    continue
+                task.limit = min(task.limit, budget['albums'])
+            elif task.kind in ('artist_albums', 'artist'):
+                task.max_albums = budget['albums']
+            planned.append((need, task))
+        planned.sort(key=lambda p: -p[0])
+        return [task for _, task in planned]
+
+    def source(self, min_need: float = 0.0, tag: str = 'coverage') -> 'CoverageSource':
+        return CoverageSource(self, min_need, tag)
+
+class CoverageSource(Source):
+    """Every registry artist with need above `min_need`, thinnest first, at its budget"""
+
+    def __init__(self, coverage: Coverage, min_need: float, tag: str):
+        self.coverage = coverage
+        self.min_need = min_need
+        self.tag = tag
+
+    def tasks(self) -> Iterator[Task]:
+        for row in self.coverage.report():
+            if row['need'] <= self.min_need:
+                continue
+            budget = Coverage.budget(row['need'])
+            yield Task('search', row['name'], 'songs', budget['songs'], self.tag)
+            if budget['videos']:
+                yield Task('search', row['name'], 'videos', budget['videos'], self.tag)
+            if budget['albums']:
+                yield Task('artist_albums', row['name'], 'artists', 1, self.tag,
+                           max_albums=budget['albums'])
+
+# ============================================
+# MAIN
+# ============================================
+
+def print_report(coverage: Coverage, top: int = 40):
+    rows = coverage.report()
+    print("=" * 70)
+    print("  🗺️  VOYO CATALOG COVERAGE")
+    print("=" * 70)
+    for tier in sorted(TIER_TARGETS):
+        tier_rows = [r for r in rows if r['tier'] == tier]
+        missing = sum(1 for r in tier_rows if not r['have'])
+        covered = sum(1 for r in tier_rows if not r['need'])
+        print(f"  Tier {tier} (target {TIER_TARGETS[tier]}): {len(tier_rows):>4} artists | "
+              f"{missing:>4} missing | {covered:>4} covered")
+    by_country: Dict[str, List[float]] = {}
+    for r in rows:
+        by_country.setdefault(r['country'], []).append(r['need'])
+    print("\n  Thinnest countries (average need):")
+    for country, needs in sorted(by_country.items(), key=lambda x: -sum(x[1]) / len(x[1]))[:10]:
+        print(f"     {country:<20} {sum(needs) / len(needs):.0%} of {len(needs)} artists")
+    print(f"\n  Biggest gaps:")
+    for r in rows[:top]:
+        print(f"     {r['name']:<28} {r['tier']}  {r['country']:<14} "
+              f"{r['have']:>4}/{r['target']:<4} need {r['need']:.0%}")
+
+def run_coverage(coverage: Coverage, workers: int = 8, min_need: float = 0.0, **engine_opts):
+    start = time.time()
+    initial = get_db_count()
+    engine = FeederEngine(concurrency=workers, checkpoint='coverage', **engine_opts)
+    stats = engine.run([coverage.source(min_need)])
+    elapsed = time.time() - start
+    print(f"\n{'=' * 70}")
+    print(f"  🗺️  COVERAGE RUN RESULTS")
+    print(f"{'=' * 70}")
+    print(f"  Initial:    {initial:,}")
+    print(f"  Final:      {initial + engine.total_inserted:,}")
+    print(f"  NEW:        +{stats.inserted:,}")
+    print(f"  Time:       {elapsed:.0f}s ({elapsed/60:.1f} min)")
+    print(f"{'=' * 70}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='VOYO Catalog Coverage')
+    parser.add_argument('--run', action='store_true', help='Crawl registry artists by gap')
+    parser.add_argument('workers', type=int, nargs='?', default=8, help='Concurrent search tasks')
+    parser.add_argument('--top', type=int, default=40, help='Gaps listed in the report')
+    parser.add_argument('--min-need', type=float, default=0.0,
+                        help='Only crawl artists whose need is above this (0-1)')
+    parser.add_argument('--refresh', action='store_true', help='Re-pull catalog artist counts')
+    add_engine_args(parser)
+    args = parser.parse_args()
+
+    coverage = Coverage.load(args.catalog_max_age, args.refresh)
+    if args.run:
+        opts = engine_options(args)
+        opts.pop('coverage', None)
+        run_coverage(coverage, workers=args.workers, min_need=args.min_need, **opts)
+    else:
+        print_report(coverage, args.top)
@@ -24,6 +24,8 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import boto3
 from botocore.config import Config
 
+from id_set import IdSet
+
 sys.stdout.reconfigure(line_buffering=True)
 
 # ============================================
@@ -142,9 +144,9 @@ def get_tracks(limit: int, offset: int) -> list:
     except:
         return []
 
-def get_existing_on_r2() -> set:
+def get_existing_on_r2() -> IdSet:
     """Get list of already uploaded tracks"""
-    existing = set()
+    existing = IdSet()
     try:
         paginator = get_r2().get_paginator('list_objects_v2')
         for page in paginator.paginate(Bucket=R2_BUCKET, Prefix="128/"):
@@ -236,7 +238,7 @@ def main():
     print(f"   Found {len(existing)} already uploaded")
 
     # Filter
-    to_process = [t for t in tracks if t not in existing]
+    to_process = existing.filter_new(tracks)
     print(f"   To process: {len(to_process)}")
 
     if not to_process:
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+VOYO Content Filter - keep interviews and 3-hour mixes out of the catalog
+==========================================================================
+
+Video searches return everything under an artist's name: interviews,
+reaction videos, podcasts, documentaries, hour-long compilations. Each one
+that reaches video_intelligence is canonized, looked up for lyrics and
+queued for audio download like a song.
+
+non_music() screens a discovered track before upload, from its title and
+duration only (no API calls):
+
+- The compilation table of canonizer_v4.detect_content_type ("best of",
+  "non stop", "hours of"...) plus non-music patterns: interview, reaction,
+  podcast, documentary, behind the scenes, trailer, vlog, tutorial...
+- Video results longer than LONG_SECONDS or shorter than SHORT_SECONDS
+- Anything longer than MAX_SECONDS, whatever YTMusic filed it under
+
+Song and album results are YTMusic-classified music, so only the duration
+cap applies to them; live, remix, cover and DJ versions are music and pass.
+
+Usage:
+    reason = non_music("Burna Boy Interview | The Breakfast Club", 1840, video=True)
+    # -> 'interview'
+"""
+
+import re
+from typing import Optional
+
+from canonizer_v4 import detect_content_type
+
+SHORT_SECONDS = 45              # clips, Shorts, teasers
+LONG_SECONDS = 20 * 60          # a video past this is a mix, compilation or talk
+MAX_SECONDS = 60 * 60           # even a Fela Kuti album side doesn't run an hour
+
+# reason -> title pattern (checked in order, first match wins). Kept narrow:
+# "Good News", "How To Save a Life" and BTS are songs.
+NON_MUSIC_PATTERNS = [
+    ('interview', r'\binterview|\bin conversation\b|\bq ?& ?a\b|\bpress conference\b|'
+                  r'\btalks? about\b|\bspeaks? on\b|\bopens up\b'),
+    ('reaction', r'\breacts?\b|\breaction\b|\breacting\b|\bfirst time hearing\b'),
+    ('podcast', r'\bpodcast\b|\bepisode \d+|\bfull episode\b'),
+    ('documentary', r'\bdocumentary\b|\bbehind the scenes\b|\bmaking of\b|\bmini[- ]?doc\b'),
+    ('trailer', r'\btrailer\b|\bteaser\b|\bsnippet\b'),
+    ('vlog', r'\bvlog\b|\bday in the life\b|\bunboxing\b|\bprank\b|\b(?:dance|tiktok) challenge\b'),
+    ('tutorial', r'\btutorial\b|\b(?:guitar|piano|drum|dance) lesson\b|\bexplained\b'),
+    ('news', r'\bnews (?:update|report)\b|\bentertainment news\b|\bgossip\b'),
+    ('comedy', r'\bskit\b|\bcomedy\b|\bfull movie\b|\bnollywood\b'),
+]
+_PATTERNS = [(reason, re.compile(pattern, re.I)) for reason, pattern in NON_MUSIC_PATTERNS]
+
+def non_music(title: str, duration: Optional[int] = None, video: bool = True) -> Optional[str]:
+    """Why a track isn't a song ('interview', 'compilation', 'long'...), or None"""
+    if duration and duration > MAX_SECONDS:
+        return 'long'
+    if not video:
+        return None
+    title = title or ''
+    if detect_content_type(title, '') == 'playlist_channel':
+        return 'compilation'
+    for reason, pattern in _PATTERNS:
+        if pattern.search(title):
+            return reason
+    if duration and duration > LONG_SECONDS:
+        return 'long'
+    if duration and duration < SHORT_SECONDS:
+        return 'short'
+    return None
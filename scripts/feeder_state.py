@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+VOYO Feeder State - on-disk memory shared by every feeder
+==========================================================
+
+Everything a feeder should remember between runs lives under STATE_DIR
+(default: <repo>/.feeder-state, override with VOYO_FEEDER_STATE).
+
+- SeenStore: append-only log of youtube_ids already upserted
+- load_json / save_json: small atomic JSON state files
+- read_constant: literal config (artist lists, domains) from a feeder script
+"""
+
+import os
+import ast
+import json
+import threading
+from pathlib import Path
+from typing import Iterable, Iterator, List, Any
+
+from id_set import IdSet
+
+STATE_DIR = Path(os.environ.get('VOYO_FEEDER_STATE', Path(__file__).parent.parent / '.feeder-state'))
+
+SEEN_LOG = STATE_DIR / 'seen_ids.log'
+
+SCRIPTS_DIR = Path(__file__).parent
+
+# ============================================
+# JSON STATE FILES
+# ============================================
+
+def state_path(name: str) -> Path:
+    path = Path(name)
+    return path if path.is_absolute() else STATE_DIR / path
+
+def load_json(name: str, default: Any = None) -> Any:
+    """Load a state file, returning `default` if missing or corrupt"""
+    path = state_path(name)
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return default
+
+def save_json(name: str, data: Any):
+    """Atomic write: tmp file + rename, so a crash never leaves half a file"""
+    path = state_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+# ============================================
+# FEEDER CONFIGS
+# ============================================
+
+def read_constant(script: str, name: str, default: Any = None) -> Any:
+    """Module-level literal `name` from scripts/<script>, without importing it.
+
+    Feeder scripts have hyphenated names and import ytmusicapi on load, so
+    their artist/query lists are read straight from the source instead.
+    """
+    tree = ast.parse((SCRIPTS_DIR / script).read_text())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+                isinstance(t, ast.Name) and t.id == name for t in node.targets):
+            return ast.literal_eval(node.value)
+    return default
+
+# ============================================
+# SEEN-ID STORE
+# ============================================
+
+class SeenStore:
+    """Persistent set of youtube_ids, backed by an append-only log.
+
+    One ID per line. Loaded fully at startup into a packed IdSet, appended
+    to with O_APPEND writes so several feeders can share the same file.
+    Lines from a crashed partial write are ignored on load.
+    """
+
+    def __init__(self, path: Path = SEEN_LOG):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.log_lines = 0
+        self.ids = IdSet(self._read_log())
+        self.fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def _read_log(self) -> Iterator[str]:
+        if not self.path.exists():
+            return
+        with open(self.path) as f:
+            for line in f:
+                vid = line.strip()
+                if len(vid) == 11:
+                    self.log_lines += 1
+                    yield vid
+
+    def __contains__(self, video_id: str) -> bool:
+        return video_id in self.ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add_many(self, video_ids: Iterable[str]) -> int:
+        """Record IDs; only the ones not already stored hit the log"""
+        with self.lock:
+            new: List[str] = [v for v in dict.fromkeys(video_ids) if self.ids.add(v)]
+            if not new:
+                return 0
+            os.write(self.fd, ''.join(f'{v}\n' for v in new).encode())
+            self.log_lines += len(new)
+            return len(new)
+
+    def add(self, video_id: str) -> bool:
+        return self.add_many([video_id]) == 1
+
+    def compact(self):
+        """Rewrite the log without duplicate lines (left by concurrent feeders)"""
+        with self.lock:
+            if self.log_lines <= len(self.ids):
+                return
+            tmp = self.path.with_suffix('.tmp')
+            with open(tmp, 'w') as f:
+                f.writelines(f'{v}\n' for v in self.ids)
+            os.replace(tmp, self.path)
+            os.close(self.fd)
+            self.fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self.log_lines = len(self.ids)
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
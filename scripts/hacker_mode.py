@@ -21,6 +21,8 @@ import threading
 import boto3
 from botocore.config import Config
 
+from id_set import IdSet
+
 sys.stdout.reconfigure(line_buffering=True)
 
 # Config
@@ -58,7 +60,7 @@ def get_tracks(limit, offset):
         return [t['youtube_id'] for t in json.loads(resp.read().decode()) if t.get('youtube_id')]
 
 def get_existing():
-    existing = set()
+    existing = IdSet()
     try:
         paginator = get_r2().get_paginator('list_objects_v2')
         # Check raw/ and legacy folders
@@ -143,7 +145,7 @@ def main():
     print(f"   Found {len(existing)} existing")
 
     # Filter
-    to_process = [t for t in tracks if t not in existing]
+    to_process = existing.filter_new(tracks)
     print(f"   To process: {len(to_process)}")
 
     if not to_process:
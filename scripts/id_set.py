@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+VOYO IdSet - compact YouTube ID set for million-track dedup
+============================================================
+
+An 11-char YouTube ID is 64 bits of base64url (the last char only carries
+4 bits). IdSet packs each ID into a uint64 and keeps them in a sorted
+array('Q') plus a small insert buffer, so 1M IDs cost ~8 MB instead of
+~100 MB for a set of str.
+
+Anything that doesn't pack (not 11 chars, foreign filenames...) falls back
+to a plain str set, so IdSet is a drop-in replacement for Set[str].
+
+Usage:
+    existing = IdSet(ids)
+    if vid in existing: ...
+    todo = existing.filter_new(candidates)
+"""
+
+import heapq
+import os
+from array import array
+from pathlib import Path
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, Optional, Set
+
+B64URL = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_'
+_DECODE = {c: i for i, c in enumerate(B64URL)}
+
+MERGE_MIN = 4096        # buffer size that triggers a merge into the sorted array
+
+# ============================================
+# PACKING
+# ============================================
+
+def pack_id(video_id: str) -> Optional[int]:
+    """11-char YouTube ID -> uint64, or None if it isn't a canonical ID"""
+    if len(video_id) != 11:
+        return None
+    value = 0
+    try:
+        for c in video_id[:10]:
+            value = (value << 6) | _DECODE[c]
+        last = _DECODE[video_id[10]]
+    except KeyError:
+        return None
+    if last & 0b11:
+        return None  # not a canonical ID: last char must be one of AEIMQUYcgkosw048
+    return (value << 4) | (last >> 2)
+
+def unpack_id(value: int) -> str:
+    chars = [B64URL[(value & 0xF) << 2]]
+    value >>= 4
+    for _ in range(10):
+        chars.append(B64URL[value & 0x3F])
+        value >>= 6
+    return ''.join(reversed(chars))
+
+# ============================================
+# ID SET
+# ============================================
+
+class IdSet:
+    """Set of YouTube IDs stored as packed uint64 values"""
+
+    def __init__(self, ids: Iterable[str] = ()):
+        self.sorted = array('Q')
+        self.buffer: Set[int] = set()
+        self.other: Set[str] = set()
+        self.update(ids)
+
+    # ---------- internal ----------
+
+    def _has_packed(self, value: int) -> bool:
+        if value in self.buffer:
+            return True
+        i = bisect_left(self.sorted, value)
+        return i < len(self.sorted) and self.sorted[i] == value
+
+    def _merge(self):
+        if not self.buffer:
+            return
+        # Buffer values are never in the array, so a plain sorted merge is enough
+        self.sorted = array('Q', heapq.merge(self.sorted, sorted(self.buffer)))
+        self.buffer = set()
+
+    def _maybe_merge(self):
+        if len(self.buffer) >= max(MERGE_MIN, len(self.sorted) >> 3):
+            self._merge()
+
+    # ---------- set API ----------
+
+    def __contains__(self, video_id: str) -> bool:
+        value = pack_id(video_id)
+        if value is None:
+            return video_id in self.other
+        return self._has_packed(value)
+
+    def __len__(self) -> int:
+        return len(self.sorted) + len(self.buffer) + len(self.other)
+
+    def __iter__(self) -> Iterator[str]:
+        self._merge()
+        for value in self.sorted:
+            yield unpack_id(value)
+        yield from self.other
+
+    def add(self, video_id: str) -> bool:
+        """Add an ID; returns True if it was not already present"""
+        value = pack_id(video_id)
+        if value is None:
+            if video_id in self.other:
+                return False
+            self.other.add(video_id)
+            return True
+        if self._has_packed(value):
+            return False
+        self.buffer.add(value)
+        self._maybe_merge()
+        return True
+
+    def update(self, ids: Iterable[str]):
+        other = []
+        for video_id in ids:
+            value = pack_id(video_id)
+            if value is None:
+                other.append(video_id)
+            elif not self._has_packed(value):
+                self.buffer.add(value)
+                self._maybe_merge()
+        self.other.update(other)
+        self._merge()
+
+    def contains_many(self, ids: List[str]) -> List[bool]:
+        """Batch membership: one sorted sweep over the array instead of N bisects"""
+        result = [False] * len(ids)
+        packed = []
+        for i, video_id in enumerate(ids):
+            value = pack_id(video_id)
+            if value is None:
+                result[i] = video_id in self.other
+            elif value in self.buffer:
+                result[i] = True
+            else:
+                packed.append((value, i))
+        packed.sort()
+        lo, n = 0, len(self.sorted)
+        for value, i in packed:
+            lo = bisect_left(self.sorted, value, lo)
+            if lo < n and self.sorted[lo] == value:
+                result[i] = True
+        return result
+
+    def filter_new(self, ids: List[str]) -> List[str]:
+        """IDs from `ids` that are not in the set, order preserved"""
+        return [v for v, known in zip(ids, self.contains_many(ids)) if not known]
+
+    # ---------- persistence ----------
+
+    def save(self, path: Path):
+        """Binary snapshot: uint64 count, packed array, then newline-joined other IDs"""
+        self._merge()
+        path = Path(path)
+        tmp = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(len(self.sorted).to_bytes(8, 'little'))
+            self.sorted.tofile(f)
+            f.write('\n'.join(sorted(self.other)).encode())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> 'IdSet':
+        ids = cls()
+        with open(path, 'rb') as f:
+            count = int.from_bytes(f.read(8), 'little')
+            ids.sorted.fromfile(f, count)
+            rest = f.read().decode()
+        ids.other = set(rest.split('\n')) if rest else set()
+        return ids
+
+    def nbytes(self) -> int:
+        """Approximate payload size (array + buffer entries)"""
+        return self.sorted.itemsize * len(self.sorted) + 8 * len(self.buffer)
@@ -25,6 +25,10 @@ import time
 from typing import Optional, List, Dict
 from dataclasses import dataclass, asdict
 
+from supabase_client import get_client
+from work_key import split_title
+from canonizer_v4 import music_only
+
 import syncedlyrics
 
 # ============================================
@@ -88,28 +92,8 @@ def get_youtube_info(youtube_id: str) -> tuple:
         with urllib.request.urlopen(req, timeout=10) as resp:
             data = json.loads(resp.read().decode())
 
-        title = data.get('title', '')
-        author = data.get('author_name', '').replace(' - Topic', '').replace('VEVO', '')
-
-        # Parse "Artist - Song" format
-        if ' - ' in title:
-            parts = title.split(' - ', 1)
-            artist = parts[0].strip()
-            song = parts[1].strip()
-        else:
-            artist = author.strip()
-            song = title
-
-        # Clean suffixes
-        song = re.sub(r'\s*\(Official.*?\)', '', song, flags=re.I)
-        song = re.sub(r'\s*\(Audio.*?\)', '', song, flags=re.I)
-        song = re.sub(r'\s*\(Lyric.*?\)', '', song, flags=re.I)
-        song = re.sub(r'\s*\[.*?\]', '', song)
-        song = re.sub(r'\s*\|.*$', '', song)
-        song = re.sub(r'\s*ft\..*$', '', song, flags=re.I)
-        song = re.sub(r'\s*feat\..*$', '', song, flags=re.I)
-
-        return artist.strip(), song.strip()
+        # "Artist - Song" split + suffix cleaning, shared with the feeders' work keys
+        return split_title(data.get('title', ''), data.get('author_name', ''))
 
     except Exception as e:
         print(f"[YouTube] Error: {e}", file=sys.stderr)
@@ -188,12 +172,13 @@ def get_lyrics_by_id(youtube_id: str, title: str = '', artist: str = '') -> Lyri
 def batch_fetch(tier: str = 'A', limit: int = 100, save_to_supabase: bool = True):
     """Batch fetch lyrics for tracks."""
     # Fetch tracks from Supabase
-    url = f"{SUPABASE_URL}/rest/v1/video_intelligence?select=youtube_id,title,artist&artist_tier=eq.{tier}&limit={limit}"
-    headers = {'apikey': SUPABASE_KEY, 'Authorization': f'Bearer {SUPABASE_KEY}'}
-
-    req = urllib.request.Request(url, headers=headers)
-    with urllib.request.urlopen(req) as resp:
-        tracks = json.loads(resp.read().decode())
+    db = get_client(SUPABASE_URL, SUPABASE_KEY)
+    tracks = db.select('video_intelligence', {
+        'select': 'youtube_id,title,artist',
+        'artist_tier': f'eq.{tier}',
+        **music_only(db),
+        'limit': limit,
+    })
 
     print(f"Processing {len(tracks)} Tier {tier} tracks...")
 
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+VOYO Shard Merge - reconcile feeder state from several hosts
+=============================================================
+
+Each host running a `--shard i/N` feeder keeps its own .feeder-state.
+Copy their seen-ID logs (album ledgers, artist graphs) to one machine and
+fold them into the local state, so the next run - sharded or not - starts from
+everything every shard already uploaded or expanded.
+
+- Seen logs: union of all IDs, written back as one compacted log
+- Album ledgers: newest expansion of every browseId wins, likewise the
+  most recently checked release watermark of every artist
+- Artist graphs (per-shard graphs and handoff files): union of artists and
+  aliases, keeping the latest visited/failed state of each
+
+Usage:
+    python3 scripts/merge_shards.py seen host0/seen_ids.log host1/seen_ids.log [--into PATH]
+    python3 scripts/merge_shards.py ledger host0/album_ledger.sqlite host1/album_ledger.sqlite
+    python3 scripts/merge_shards.py graph host0/artist_graph_0of2.json host1/artist_graph_1of2.json
+"""
+
+import argparse
+from pathlib import Path
+from typing import List
+
+from feeder_state import SeenStore, SEEN_LOG
+from feeder_state import load_json
+from album_ledger import AlbumLedger, LEDGER_PATH
+from artist_graph import ArtistGraph, STATE_FILE as GRAPH_FILE
+
+def merge_seen(paths: List[Path], into: Path = SEEN_LOG) -> int:
+    """Fold shard seen logs into `into`; returns how many IDs were new to it"""
+    store = SeenStore(into)
+    added = 0
+    for path in paths:
+        shard = SeenStore(path)
+        n = store.add_many(iter(shard.ids))
+        shard.close()
+        print(f"  📥 {path}: {len(shard):,} IDs, {n:,} new")
+        added += n
+    store.compact()
+    store.close()
+    return added
+
+def merge_ledgers(paths: List[Path], into: Path = LEDGER_PATH) -> int:
+    """Fold shard album ledgers into `into`, keeping the newest row per browseId"""
+    ledger = AlbumLedger(into)
+    before = len(ledger)
+    for path in paths:
+        with ledger.lock:
+            ledger.db.execute('ATTACH DATABASE ? AS shard', (str(path),))
+            try:
+                ledger.db.execute('''INSERT INTO albums SELECT * FROM shard.albums s WHERE true
+                    ON CONFLICT(browse_id) DO UPDATE SET
+                        kind = excluded.kind, track_ids = excluded.track_ids,
+                        track_count = excluded.track_count, expanded = excluded.expanded
+                    WHERE excluded.expanded > albums.expanded''')
+                if ledger.db.execute("SELECT 1 FROM shard.sqlite_master "
+                                     "WHERE name = 'artists'").fetchone():
+                    ledger.db.execute('''INSERT INTO artists SELECT * FROM shard.artists s WHERE true
+                        ON CONFLICT(browse_id) DO UPDATE SET
+                            name = excluded.name, newest = excluded.newest,
+                            checked = excluded.checked
+                        WHERE excluded.checked > artists.checked''')
+            finally:
+                ledger.db.execute('DETACH DATABASE shard')
+        print(f"  📥 {path}: merged")
+    added = len(ledger) - before
+    ledger.close()
+    return added
+
+def merge_graphs(paths: List[Path], into: str = GRAPH_FILE) -> int:
+    """Fold shard artist graphs (or handoff files) into `into`; returns new artists"""
+    graph = ArtistGraph(into)
+    added = 0
+    for path in paths:
+        state = load_json(str(path.resolve()), {})
+        n = graph.merge(state.get('nodes', {}), state.get('aliases', {}))
+        print(f"  📥 {path}: {len(state.get('nodes', {})):,} artists, {n:,} new")
+        added += n
+    graph.save()
+    return added
+
+# ============================================
+# MAIN
+# ============================================
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='VOYO Shard Merge')
+    parser.add_argument('kind', choices=['seen', 'ledger', 'graph'], help='What to merge')
+    parser.add_argument('paths', nargs='+', type=Path, help='Per-shard files')
+    parser.add_argument('--into', type=Path, help='Target file (default: local state)')
+    args = parser.parse_args()
+
+    if args.kind == 'seen':
+        added = merge_seen(args.paths, args.into or SEEN_LOG)
+        print(f"✅ Seen log: +{added:,} IDs")
+    elif args.kind == 'graph':
+        added = merge_graphs(args.paths, str(args.into.resolve()) if args.into else GRAPH_FILE)
+        print(f"✅ Artist graph: +{added:,} artists")
+    else:
+        added = merge_ledgers(args.paths, args.into or LEDGER_PATH)
+        print(f"✅ Album ledger: +{added:,} albums")
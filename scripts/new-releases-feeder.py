@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+VOYO NEW RELEASES FEEDER - Built by DASH & ZION
+================================================
+
+FRESH DROPS ONLY. NO FULL RE-CRAWLS.
+
+Every artist page a feeder has opened is watermarked in the album ledger
+(newest single and album seen). This refresh pulls each known artist's
+page once, expands only the releases that are newer than the watermark,
+and pages through the full discography only when the whole preview is
+new. A daily run costs about one call per artist plus the new albums.
+
+Usage:
+    python3 scripts/new-releases-feeder.py [workers] [--min-hours 20] [--max-new 5] [--resume] [--shard i/N] [--rate 8]
+"""
+
+import sys
+import time
+import argparse
+
+from feeder_engine import (
+    FeederEngine, ReleaseSource, get_db_count, add_engine_args, engine_options
+)
+
+def run_refresh(workers: int = 8, min_hours: float = 20, max_new: int = 5, **engine_opts):
+    """Check every watched artist not checked in the last `min_hours`"""
+    print("=" * 70)
+    print("  🆕 VOYO NEW RELEASES FEEDER - Built by DASH & ZION 🆕")
+    print("  FRESH DROPS ONLY. NO FULL RE-CRAWLS.")
+    print("=" * 70)
+
+    ledger = engine_opts.get('ledger')
+    if ledger is None:
+        print("  ❌ The refresh needs the album ledger (drop --no-ledger)")
+        sys.exit(1)
+
+    artists = ledger.artists(checked_before=time.time() - min_hours * 3600)
+    print(f"  👀 Artists due for a check: {len(artists):,}")
+    if not artists:
+        print("  ✅ Nothing to refresh - run a discography/graph feeder first to watch artists")
+        return
+
+    start_time = time.time()
+    initial_count = get_db_count()
+    print(f"  📊 Initial database count: {initial_count:,} tracks")
+
+    engine = FeederEngine(concurrency=workers, checkpoint='releases', **engine_opts)
+    stats = engine.run([ReleaseSource([browse_id for browse_id, _ in artists], max_new=max_new)])
+
+    elapsed = time.time() - start_time
+    print()
+    print("=" * 70)
+    print("  🆕 REFRESH RESULTS 🆕")
+    print("=" * 70)
+    print(f"  Artists checked:   {stats.tasks:,}")
+    print(f"  New releases:      {stats.releases:,}")
+    print(f"  NEW TRACKS:        +{stats.inserted:,}")
+    print(f"  API calls:         {stats.calls:,} ({stats.calls / max(stats.tasks, 1):.1f} per artist)")
+    print(f"  Time elapsed:      {elapsed:.1f}s ({elapsed/60:.1f} min)")
+    print("=" * 70)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='VOYO New Releases Feeder')
+    parser.add_argument('workers', type=int, nargs='?', default=8, help='Concurrent artist checks')
+    parser.add_argument('--min-hours', type=float, default=20,
+                        help='Skip artists checked more recently than this (default 20)')
+    parser.add_argument('--max-new', type=int, default=5,
+                        help='New singles/albums expanded per artist and section (default 5)')
+    add_engine_args(parser)
+    args = parser.parse_args()
+    run_refresh(workers=args.workers, min_hours=args.min_hours, max_new=args.max_new,
+                **engine_options(args))
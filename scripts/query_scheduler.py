@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+VOYO Query Scheduler - spend API calls where new tracks are
+============================================================
+
+Records the new-track yield of every artist/query the feeders run
+(new IDs / results returned), persists it across runs and uses it to
+pick the next round:
+
+- Exploit: highest-yield items first, searched deeper (bigger limits)
+- Explore: a share of each round goes to never-run items
+- Retire: items that return nothing new for RETIRE_AFTER rounds are
+  parked for RETIRE_DAYS, then get one more chance
+
+Usage:
+    scheduler = QueryScheduler()
+    engine = FeederEngine(on_task=scheduler.record)
+    engine.run([scheduler.source(scheduler.pick(candidates, 300))])
+    scheduler.end_round()
+"""
+
+import time
+import random
+from typing import Dict, List, Iterator, Optional
+
+from feeder_state import load_json, save_json
+from feeder_engine import Task, Source
+
+STATE_FILE = 'query_yield.json'
+
+EWMA_ALPHA = 0.4        # weight of the latest round in the yield score
+EXPLORE_SHARE = 0.3     # share of each round given to unseen items
+RETIRE_AFTER = 3        # consecutive zero-yield rounds before retiring
+RETIRE_DAYS = 7         # how long a retired item sits out
+MAX_DEPTH = 4           # limit multiplier for the most productive items
+
+class QueryScheduler:
+    def __init__(self, state_file: str = STATE_FILE):
+        self.state_file = state_file
+        self.stats: Dict[str, Dict] = load_json(state_file, {})
+        self.round: Dict[str, List[int]] = {}
+
+    # ---------- recording ----------
+
+    def record(self, task: Task, returned: int, new: int):
+        """FeederEngine on_task hook: accumulate this round's results per item"""
+        acc = self.round.setdefault(task.query, [0, 0])
+        acc[0] += returned
+        acc[1] += new
+
+    def end_round(self):
+        """Fold this round into the persistent scores and save"""
+        now = time.time()
+        for item, (returned, new) in self.round.items():
+            s = self.stats.setdefault(item, {'runs': 0, 'returned': 0, 'new': 0,
+                                             'score': 0.0, 'zero_streak': 0})
+            y = new / returned if returned else 0.0
+            s['score'] = y if s['runs'] == 0 else EWMA_ALPHA * y + (1 - EWMA_ALPHA) * s['score']
+            s['runs'] += 1
+            s['returned'] += returned
+            s['new'] += new
+            s['last_run'] = now
+            s['zero_streak'] = s['zero_streak'] + 1 if new == 0 else 0
+            if s['zero_streak'] >= RETIRE_AFTER:
+                s['retired_until'] = now + RETIRE_DAYS * 86400
+                s['zero_streak'] = 0
+        self.round = {}
+        save_json(self.state_file, self.stats)
+
+    # ---------- planning ----------
+
+    def is_retired(self, item: str, now: Optional[float] = None) -> bool:
+        until = self.stats.get(item, {}).get('retired_until')
+        return bool(until) and (now or time.time()) < until
+
+    def pick(self, candidates: List[str], n: int, explore: float = EXPLORE_SHARE) -> List[str]:
+        """Choose `n` items: top scorers plus a share of unseen ones"""
+        now = time.time()
+        candidates = list(dict.fromkeys(candidates))
+        unseen = [c for c in candidates if c not in self.stats]
+        known = [c for c in candidates if c in self.stats and not self.is_retired(c, now)]
+        known.sort(key=lambda c: self.stats[c]['score'], reverse=True)
+
+        n_explore = min(len(unseen), max(int(n * explore), n - len(known)))
+        picked = known[:n - n_explore] + unseen[:n_explore]
+        random.shuffle(picked)
+        return picked
+
+    def depth(self, item: str) -> int:
+        """Limit multiplier: productive items are searched deeper"""
+        score = self.stats.get(item, {}).get('score', 0.0)
+        return max(1, min(MAX_DEPTH, 1 + int(score * MAX_DEPTH)))
+
+    def source(self, items: List[str], limits: Optional[Dict[str, int]] = None,
+               tag: str = 'scheduled') -> 'ScheduledSource':
+        return ScheduledSource(self, items, limits or {'songs': 30, 'videos': 15}, tag)
+
+    def summary(self) -> Dict[str, int]:
+        now = time.time()
+        return {
+            'tracked': len(self.stats),
+            'retired': sum(1 for i in self.stats if self.is_retired(i, now)),
+            'productive': sum(1 for s in self.stats.values() if s['score'] > 0),
+        }
+
+class ScheduledSource(Source):
+    """Like QuerySource, but limits scale with each item's yield score"""
+
+    def __init__(self, scheduler: QueryScheduler, items: List[str],
+                 limits: Dict[str, int], tag: str):
+        self.scheduler = scheduler
+        self.items = items
+        self.limits = limits
+        self.tag = tag
+
+    def tasks(self) -> Iterator[Task]:
+        for item in self.items:
+            depth = self.scheduler.depth(item)
+            for search_filter, limit in self.limits.items():
+                yield Task('search', item, search_filter, min(limit * depth, 100), self.tag)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+VOYO Query Space - every generated query once, in a stable order
+================================================================
+
+The autonomous beast's generated queries are cross products (region x
+genre x year, viral prefix x genre...). Building and shuffling the whole
+list every round repeats some combinations and never reaches others.
+
+QuerySpace enumerates the product lazily instead:
+
+- Index -> query by mixed-radix decoding: nothing is materialized
+- A seeded affine permutation (i * a + b) mod N walks every index exactly
+  once per cycle, spread across the whole space; each cycle reseeds it
+- The cursor is persisted, so runs and rounds continue where the last
+  one stopped; editing the axes starts a fresh walk
+
+Usage:
+    space = QuerySpace([('{} {} {}', [regions, genres, years])])
+    queries = space.peek(200)
+    ...run the ones you use...
+    space.advance(len(used))
+"""
+
+import math
+import hashlib
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from feeder_state import load_json, save_json
+
+STATE_FILE = 'query_space.json'
+GOLDEN = 0.6180339887   # step ~N/phi: consecutive queries land far apart
+
+Family = Tuple[str, Sequence[Sequence[str]]]
+
+class QuerySpace:
+    """Concatenated product spaces, one `template.format(*axes)` per index"""
+
+    def __init__(self, families: List[Family], state_file: str = STATE_FILE, seed: str = 'voyo'):
+        self.families = [(template, [list(axis) for axis in axes]) for template, axes in families]
+        self.sizes = [math.prod(len(axis) for axis in axes) for _, axes in self.families]
+        self.size = sum(self.sizes)
+        self.state_file = state_file
+        self.seed = seed
+        signature = hashlib.blake2b(repr((seed, self.families)).encode(), digest_size=8).hexdigest()
+        state = load_json(state_file, {})
+        self.position = state.get('position', 0) if state.get('signature') == signature else 0
+        self.signature = signature
+        self._peeked: List[int] = []
+        self._scanned = self.position
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def cycle(self) -> int:
+        return self.position // max(self.size, 1)
+
+    @property
+    def covered(self) -> int:
+        """Queries handed out in the current cycle"""
+        return self.position % max(self.size, 1)
+
+    # ---------- enumeration ----------
+
+    def query(self, index: int) -> str:
+        """The index-th query of the concatenated spaces"""
+        for (template, axes), size in zip(self.families, self.sizes):
+            if index < size:
+                parts = []
+                for axis in reversed(axes):
+                    index, digit = divmod(index, len(axis))
+                    parts.append(axis[digit])
+                return template.format(*reversed(parts))
+            index -= size
+        raise IndexError(index)
+
+    def _permutation(self, cycle: int) -> Tuple[int, int]:
+        """(a, b) of this cycle's bijection i -> (i * a + b) mod size"""
+        h = int.from_bytes(hashlib.blake2b(f'{self.seed}|{cycle}'.encode(),
+                                           digest_size=8).digest(), 'big')
+        n = self.size
+        a = (int(n * GOLDEN) + h % max(n // 8, 1)) % n or 1
+        while math.gcd(a, n) != 1:
+            a = a % n + 1
+        return a, (h >> 16) % n
+
+    def at(self, position: int) -> str:
+        """Query at an absolute cursor position (cycle = position // size)"""
+        a, b = self._permutation(position // self.size)
+        return self.query((position % self.size * a + b) % self.size)
+
+    # ---------- cursor ----------
+
+    def peek(self, n: int, accept: Optional[Callable[[str], bool]] = None) -> List[str]:
+        """Next `n` accepted queries from the cursor, without moving it.
+
+        Rejected ones (another shard's, already tracked) are passed over
+        and count as covered on advance(). Scans at most one full cycle: a
+        space that accepts nothing returns [] and advance() moves the cursor
+        into the next cycle.
+        """
+        self._peeked = []
+        queries = []
+        position = self.position
+        while len(queries) < n and position < self.position + self.size:
+            q = self.at(position)
+            if accept is None or accept(q):
+                queries.append(q)
+                self._peeked.append(position)
+            position += 1
+        self._scanned = position
+        return queries
+
+    def advance(self, consumed: int):
+        """Move past the first `consumed` peeked queries and every rejected one
+        scanned before the next peeked query, then save the cursor"""
+        if consumed < len(self._peeked):
+            self.position = self._peeked[consumed]
+        else:
+            self.position = max(self.position, self._scanned)
+        self._peeked = []
+        save_json(self.state_file, {'signature': self.signature, 'position': self.position,
+                                    'size': self.size})
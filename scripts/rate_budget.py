@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+VOYO Rate Budget - one request budget for every script on the machine
+======================================================================
+
+Each feeder paces itself, but five feeders at 8 calls/s are 40 calls/s
+to YTMusic. A RateBudget is shared by every process through a small file
+under STATE_DIR/budget/<name>:
+
+- GCRA scheduling: the file holds the next free slot and the rate; a
+  caller takes the slot under an flock and sleeps until it comes up, so
+  waiting processes never stampede and the aggregate never exceeds the rate
+- Bursts up to BURST_SECONDS of permits after an idle spell
+- The rate lives in the file: `rate_budget.py set ytmusic 12` retunes every
+  running script; 0 turns the budget off
+
+Budgets in use:
+    ytmusic   - every YTMusic call (feeder engine, research via the VOYO API)
+    supabase  - every PostgREST request (supabase_client)
+
+Initial rates come from DEFAULT_BUDGETS or VOYO_BUDGET_<NAME>.
+
+Usage:
+    acquire('ytmusic')                          # blocks until a permit is free
+    python3 scripts/rate_budget.py [status]
+    python3 scripts/rate_budget.py set supabase 40
+"""
+
+import os
+import time
+import struct
+import argparse
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+
+from feeder_state import STATE_DIR
+
+try:
+    import fcntl
+except ImportError:         # no flock (Windows): the budget only spans this process
+    fcntl = None
+
+BUDGET_DIR = STATE_DIR / 'budget'
+DEFAULT_BUDGETS = {'ytmusic': 20.0, 'supabase': 30.0}   # permits/sec, machine-wide
+BURST_SECONDS = 1.0
+_RECORD = struct.Struct('<dd')                          # (next free slot, rate)
+
+class RateBudget:
+    """Cross-process token bucket kept in one flock'ed file"""
+
+    def __init__(self, name: str, rate: Optional[float] = None, directory: Path = BUDGET_DIR):
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        self.name = name
+        self.path = Path(directory) / name
+        self.lock = threading.Lock()    # flock doesn't exclude threads sharing the fd
+        self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if rate is None:
+            rate = float(os.environ.get(f'VOYO_BUDGET_{name.upper()}',
+                                        DEFAULT_BUDGETS.get(name, 0.0)))
+        with self._locked():
+            if os.fstat(self.fd).st_size < _RECORD.size:
+                self._write(0.0, rate)
+        self.waited = 0.0           # summed over this process's calls
+        self.permits = 0
+
+    @contextmanager
+    def _locked(self):
+        with self.lock:
+            if fcntl is not None:
+                fcntl.flock(self.fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+    def _read(self):
+        os.lseek(self.fd, 0, os.SEEK_SET)
+        return _RECORD.unpack(os.read(self.fd, _RECORD.size))
+
+    def _write(self, slot: float, rate: float):
+        os.lseek(self.fd, 0, os.SEEK_SET)
+        os.write(self.fd, _RECORD.pack(slot, rate))
+
+    def reserve(self, n: float = 1.0) -> float:
+        """Take the next `n` permits; returns how long to wait before using them"""
+        with self._locked():
+            slot, rate = self._read()
+            if rate <= 0:
+                return 0.0
+            now = time.time()
+            # Idle spell: allow a burst, but no more than BURST_SECONDS worth
+            start = max(slot, now - BURST_SECONDS)
+            self._write(start + n / rate, rate)
+            wait = max(0.0, start - now)
+            self.permits += 1
+            self.waited += wait
+        return wait
+
+    def acquire(self, n: float = 1.0):
+        wait = self.reserve(n)
+        if wait > 0:
+            time.sleep(wait)
+
+    @property
+    def rate(self) -> float:
+        with self._locked():
+            return self._read()[1]
+
+    def set_rate(self, rate: float):
+        with self._locked():
+            slot, _ = self._read()
+            self._write(slot, rate)
+
+    def backlog(self) -> float:
+        """Seconds of permits already handed out ahead of now"""
+        with self._locked():
+            slot, _ = self._read()
+        return max(0.0, slot - time.time())
+
+# ============================================
+# SHARED BUDGETS
+# ============================================
+
+_budgets: Dict[str, Optional[RateBudget]] = {}
+_budgets_lock = threading.Lock()
+
+def budget(name: str) -> Optional[RateBudget]:
+    """This process's handle on a machine-wide budget (None if it can't be opened)"""
+    with _budgets_lock:
+        if name not in _budgets:
+            try:
+                _budgets[name] = RateBudget(name)
+            except OSError as e:
+                print(f"  ⚠️ Rate budget '{name}' unavailable ({e}): pacing this process only")
+                _budgets[name] = None
+        return _budgets[name]
+
+def acquire(name: str, n: float = 1.0):
+    """Block until `n` permits of the named budget are free"""
+    b = budget(name)
+    if b is not None:
+        b.acquire(n)
+
+# ============================================
+# MAIN
+# ============================================
+
+def status():
+    names = sorted(set(DEFAULT_BUDGETS) | {p.name for p in BUDGET_DIR.glob('*') if p.is_file()})
+    for name in names:
+        b = RateBudget(name)
+        rate = b.rate
+        print(f"  🪙 {name:<10} {f'{rate:g}/s' if rate > 0 else 'off':>8} | "
+              f"{b.backlog():.1f}s of permits queued ({b.path})")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='VOYO Rate Budget')
+    parser.add_argument('command', nargs='?', choices=['status', 'set'], default='status')
+    parser.add_argument('name', nargs='?', help='Budget to retune (set)')
+    parser.add_argument('rate', nargs='?', type=float, help='Permits/sec, 0 = unlimited (set)')
+    args = parser.parse_args()
+
+    if args.command == 'set':
+        if args.name is None or args.rate is None:
+            parser.error('set needs a budget name and a rate')
+        RateBudget(args.name).set_rate(args.rate)
+    status()
@@ -19,6 +19,8 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
 
+from rate_budget import acquire
+
 VOYO_API = "https://voyo-music-api.fly.dev"
 
 # Tier thresholds based on view counts
@@ -48,6 +50,7 @@ def fetch_artist_views(artist_name: str, limit: int = 10) -> Optional[Dict]:
         url = f"{VOYO_API}/api/search?q={encoded}&limit={limit}"
 
         req = urllib.request.Request(url, headers={'User-Agent': 'VOYO-Research/1.0'})
+        acquire('ytmusic')  # the API searches YouTube upstream: same budget as the feeders
         with urllib.request.urlopen(req, timeout=15) as response:
             data = json.loads(response.read().decode())
 
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+VOYO Supabase Client - one pooled keep-alive client for every script
+=====================================================================
+
+Thin PostgREST client on top of http.client. Every urlopen() used to pay
+a fresh TCP + TLS handshake per request; this keeps a small pool of
+persistent connections per project and reuses them across threads.
+
+- Keep-alive connection pool, stale connections retried once
+- gzip responses (catalog pulls shrink ~5x on the wire)
+- Typed API: select / upsert / patch / count / rpc, errors raise SupabaseError
+- Every request takes a permit from the machine-wide 'supabase' budget
+  (rate_budget.py), however many scripts are running
+
+Usage:
+    db = get_client(SUPABASE_URL, SUPABASE_KEY)
+    rows = db.select('video_intelligence', {'select': 'youtube_id', 'limit': 1000})
+    db.upsert('video_intelligence', tracks)
+"""
+
+import gzip
+import json
+import queue
+import threading
+import http.client
+import urllib.parse
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from rate_budget import acquire
+
+DEFAULT_TIMEOUT = 30.0
+POOL_SIZE = 16
+
+Params = Union[Dict[str, Any], Sequence[Tuple[str, Any]]]
+
+# Errors a reused keep-alive connection raises when the server already closed it
+STALE_ERRORS = (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                http.client.BadStatusLine, BrokenPipeError, ConnectionResetError)
+
+class SupabaseError(Exception):
+    def __init__(self, status: int, body: str):
+        super().__init__(f"HTTP {status}: {body[:300]}")
+        self.status = status
+        self.body = body
+
+@dataclass
+class Response:
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode()) if self.body else None
+
+class SupabaseClient:
+    """PostgREST client with a pool of keep-alive connections (thread-safe)"""
+
+    def __init__(self, url: str, key: str, pool_size: int = POOL_SIZE,
+                 timeout: float = DEFAULT_TIMEOUT):
+        parts = urllib.parse.urlsplit(url)
+        self.https = parts.scheme == 'https'
+        self.host = parts.hostname
+        self.port = parts.port
+        self.base = parts.path.rstrip('/') + '/rest/v1'
+        self.timeout = timeout
+        self.pool: queue.LifoQueue = queue.LifoQueue(maxsize=pool_size)
+        self.columns: Dict[Tuple[str, str], bool] = {}
+        self.headers = {
+            'apikey': key,
+            'Authorization': f'Bearer {key}',
+            'Accept-Encoding': 'gzip',
+            'Connection': 'keep-alive',
+        }
+
+    # ---------- connections ----------
+
+    def _connect(self) -> http.client.HTTPConnection:
+        try:
+            return self.pool.get_nowait()
+        except queue.Empty:
+            cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+            return cls(self.host, self.port, timeout=self.timeout)
+
+    def _release(self, conn: http.client.HTTPConnection):
+        try:
+            self.pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self):
+        while True:
+            try:
+                self.pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    # ---------- raw request ----------
+
+    def request(self, method: str, table: str, params: Optional[Params] = None,
+                body: Any = None, prefer: Optional[str] = None,
+                headers: Optional[Dict[str, str]] = None,
+                timeout: Optional[float] = None) -> Response:
+        """One PostgREST call; raises SupabaseError on HTTP >= 400"""
+        path = f'{self.base}/{table}'
+        if params:
+            path += '?' + urllib.parse.urlencode(params, safe='*,.()')
+        hdrs = dict(self.headers)
+        if prefer:
+            hdrs['Prefer'] = prefer
+        if headers:
+            hdrs.update(headers)
+        data = None
+        if body is not None:
+            data = json.dumps(body).encode('utf-8')
+            hdrs['Content-Type'] = 'application/json'
+
+        acquire('supabase')
+        for attempt in range(2):
+            conn = self._connect()
+            fresh = conn.sock is None
+            conn.timeout = timeout or self.timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(conn.timeout)
+            try:
+                conn.request(method, path, body=data, headers=hdrs)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except STALE_ERRORS:
+                conn.close()
+                if fresh or attempt:
+                    raise
+                continue
+            except Exception:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            if resp.getheader('Content-Encoding', '') == 'gzip':
+                raw = gzip.decompress(raw)
+            if resp.status >= 400:
+                raise SupabaseError(resp.status, raw.decode('utf-8', 'replace'))
+            return Response(resp.status, {k.lower(): v for k, v in resp.getheaders()}, raw)
+
+    # ---------- typed API ----------
+
+    def select(self, table: str, params: Optional[Params] = None,
+               timeout: Optional[float] = None) -> List[Dict]:
+        return self.request('GET', table, params, timeout=timeout).json() or []
+
+    def upsert(self, table: str, rows: List[Dict], on_conflict: Optional[str] = None,
+               ignore_duplicates: bool = False, timeout: Optional[float] = None) -> int:
+        """Insert-or-merge `rows`; returns how many were sent"""
+        if not rows:
+            return 0
+        resolution = 'ignore-duplicates' if ignore_duplicates else 'merge-duplicates'
+        params = {'on_conflict': on_conflict} if on_conflict else None
+        self.request('POST', table, params, body=rows,
+                     prefer=f'resolution={resolution},return=minimal', timeout=timeout)
+        return len(rows)
+
+    def patch(self, table: str, data: Dict, filters: Params,
+              timeout: Optional[float] = None) -> bool:
+        self.request('PATCH', table, filters, body=data, prefer='return=minimal',
+                     timeout=timeout)
+        return True
+
+    def rpc(self, function: str, args: Dict, timeout: Optional[float] = None) -> Any:
+        """Call a Postgres function exposed by PostgREST"""
+        return self.request('POST', f'rpc/{function}', body=args, timeout=timeout).json()
+
+    def has_column(self, table: str, column: str) -> bool:
+        """Whether `table.column` exists (checked once per client): lets readers use
+        a column from a migration that may not be deployed yet"""
+        if (table, column) not in self.columns:
+            try:
+                self.request('GET', table, {'select': column, 'limit': 0})
+                self.columns[(table, column)] = True
+            except SupabaseError as e:
+                if e.status != 400:
+                    raise
+                self.columns[(table, column)] = False
+        return self.columns[(table, column)]
+
+    def count(self, table: str, filters: Optional[Params] = None, mode: str = 'exact',
+              timeout: Optional[float] = None) -> int:
+        """Row count from Content-Range (mode: exact | planned | estimated)"""
+        params = [('select', '*')] + list(dict(filters).items() if isinstance(filters, dict)
+                                          else filters or [])
+        resp = self.request('HEAD', table, params, prefer=f'count={mode}',
+                            headers={'Range-Unit': 'items', 'Range': '0-0'}, timeout=timeout)
+        total = resp.headers.get('content-range', '').split('/')[-1]
+        return int(total) if total.isdigit() else 0
+
+# ============================================
+# SHARED CLIENTS
+# ============================================
+
+_clients: Dict[Tuple[str, str], SupabaseClient] = {}
+_clients_lock = threading.Lock()
+
+def get_client(url: str, key: str) -> SupabaseClient:
+    """One shared pooled client per (project, key) in this process"""
+    with _clients_lock:
+        client = _clients.get((url, key))
+        if client is None:
+            client = _clients[(url, key)] = SupabaseClient(url, key)
+        return client
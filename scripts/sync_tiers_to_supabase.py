@@ -15,8 +15,8 @@ import os
 import re
 from pathlib import Path
 from datetime import datetime
-import urllib.request
-import urllib.parse
+
+from supabase_client import get_client, SupabaseError
 
 # Supabase config
 SUPABASE_URL = "https://jnqgjsgqlnvhakpfeify.supabase.co"
@@ -88,34 +88,16 @@ def load_artist_tiers():
 
 def supabase_request(method: str, endpoint: str, data: dict = None, params: dict = None):
     """Make a request to Supabase REST API."""
-    url = f"{SUPABASE_URL}/rest/v1/{endpoint}"
-    if params:
-        url += "?" + urllib.parse.urlencode(params)
-
-    headers = {
-        'apikey': SUPABASE_KEY,
-        'Authorization': f'Bearer {SUPABASE_KEY}',
-        'Content-Type': 'application/json',
-        'Prefer': 'return=minimal'
-    }
-
-    body = json.dumps(data).encode() if data else None
-    req = urllib.request.Request(url, data=body, headers=headers, method=method)
-
     try:
-        with urllib.request.urlopen(req, timeout=30) as response:
-            if response.status in [200, 201, 204]:
-                try:
-                    return json.loads(response.read().decode())
-                except:
-                    return True
-            return None
-    except urllib.error.HTTPError as e:
-        print(f"HTTP Error {e.code}: {e.reason}")
+        response = get_client(SUPABASE_URL, SUPABASE_KEY).request(
+            method, endpoint, params, body=data or None, prefer='return=minimal')
         try:
-            print(e.read().decode())
-        except:
-            pass
+            return response.json() or True
+        except ValueError:
+            return True
+    except SupabaseError as e:
+        print(f"HTTP Error {e.status}")
+        print(e.body)
         return None
     except Exception as e:
         print(f"Error: {e}")
@@ -129,30 +111,21 @@ def fetch_all_tracks(batch_size: int = 1000):
     while True:
         print(f"  Fetching tracks {offset} to {offset + batch_size}...")
 
-        url = f"{SUPABASE_URL}/rest/v1/video_intelligence"
         params = {
             'select': 'youtube_id,artist',
             'limit': batch_size,
             'offset': offset
         }
-        url += "?" + urllib.parse.urlencode(params)
-
-        headers = {
-            'apikey': SUPABASE_KEY,
-            'Authorization': f'Bearer {SUPABASE_KEY}',
-        }
-
-        req = urllib.request.Request(url, headers=headers)
 
         try:
-            with urllib.request.urlopen(req, timeout=60) as response:
-                batch = json.loads(response.read().decode())
-                if not batch:
-                    break
-                tracks.extend(batch)
-                offset += batch_size
-                if len(batch) < batch_size:
-                    break
+            batch = get_client(SUPABASE_URL, SUPABASE_KEY).select(
+                'video_intelligence', params, timeout=60)
+            if not batch:
+                break
+            tracks.extend(batch)
+            offset += batch_size
+            if len(batch) < batch_size:
+                break
         except Exception as e:
             print(f"Error fetching: {e}")
             break
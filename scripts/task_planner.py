@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+VOYO Task Planner - every feeder's lists, searched once
+========================================================
+
+The feeder configs overlap: Rihanna sits in usa_rnb_soul and caribbean,
+Koffi Olomide and Ella Mai appear twice, the deep-dive, mass and beast
+artist lists share dozens of names. Run separately, every copy is
+searched again.
+
+This reads the artist/query lists of every feeder (without importing
+them), builds each feeder's tasks at its own limits, and merges them into
+one TaskPlan: one search per normalized query, at the deepest limit any
+feeder asked for, tagged with the first domain that requested it.
+
+Usage:
+    python3 scripts/task_planner.py                 # report the overlap
+    python3 scripts/task_planner.py --run [workers] [--resume] [--shard i/N] [--rate 8]
+"""
+
+import time
+import argparse
+from typing import Dict, List
+
+from feeder_state import read_constant
+from feeder_engine import (
+    Source, DomainSource, QuerySource, AlbumCrawlSource, TaskPlan, FeederEngine,
+    get_db_count, add_engine_args, engine_options
+)
+
+def _domains(script: str, name: str, artist_limits: Dict[str, int],
+             query_limits: Dict[str, int]) -> List[Source]:
+    return [DomainSource(domain, config, artist_limits=artist_limits, query_limits=query_limits)
+            for domain, config in read_constant(script, name, {}).items()]
+
+def feeder_sources() -> Dict[str, List[Source]]:
+    """Each feeder's sources, with the limits its own run uses"""
+    return {
+        'ultimate': _domains('ultimate-feeder.py', 'ULTIMATE_DOMAINS',
+                             {'songs': 30, 'videos': 15}, {'songs': 40, 'videos': 20}),
+        'nuclear': _domains('nuclear-feeder.py', 'DOMAINS',
+                            {'songs': 40, 'videos': 20}, {'songs': 50, 'videos': 30}),
+        'deep_dive': [QuerySource(read_constant('deep-dive-feeder.py', 'UNDERGROUND_ARTISTS', [])
+                                  + read_constant('deep-dive-feeder.py', 'NICHE_QUERIES', []),
+                                  limits={'songs': 50, 'videos': 50}, tag='deep_dive',
+                                  albums=10, album_tracks=20)],
+        'mass': [AlbumCrawlSource(read_constant('mass-feeder.py', 'AFRICAN_ARTISTS', []),
+                                  max_albums=10, songs_limit=50, tag='artists'),
+                 QuerySource(read_constant('mass-feeder.py', 'BULK_QUERIES', []),
+                             limits={'songs': 50, 'videos': 30}, tag='queries')],
+        'beast': [QuerySource(read_constant('autonomous-beast.py', 'ALL_ARTISTS', []),
+                              limits={'songs': 30, 'videos': 15}, tag='beast')],
+    }
+
+def all_sources() -> List[Source]:
+    return [s for sources in feeder_sources().values() for s in sources]
+
+def report(top: int = 15):
+    print("=" * 70)
+    print("  🧭 VOYO TASK PLANNER")
+    print("=" * 70)
+    for feeder, sources in feeder_sources().items():
+        plan = TaskPlan(FeederEngine._interleave(sources))
+        print(f"  {feeder:<12} {plan.requested:>6,} tasks requested, "
+              f"{plan.redundant:>5,} redundant within the feeder")
+
+    plan = TaskPlan(FeederEngine._interleave(all_sources()))
+    print("-" * 70)
+    print(f"  All feeders: {plan.requested:,} tasks requested -> {len(plan.tasks):,} planned")
+    print(f"  ✂️  Redundant searches eliminated: {plan.redundant:,} "
+          f"({plan.redundant / max(plan.requested, 1):.0%})")
+    shared = plan.shared()
+    if shared:
+        print(f"\n  Most shared ({len(shared):,} queries requested by several domains):")
+        for query, tags in shared[:top]:
+            print(f"     {query:<30} {', '.join(tags)}")
+
+def run_plan(workers: int = 8, **engine_opts):
+    """Run every feeder's lists as one deduplicated workload"""
+    start = time.time()
+    initial = get_db_count()
+    print(f"📊 Initial database count: {initial:,} tracks")
+
+    engine = FeederEngine(concurrency=workers, checkpoint='planner', **engine_opts)
+    stats = engine.run(all_sources())
+
+    elapsed = time.time() - start
+    print(f"\n{'=' * 70}")
+    print(f"  🧭 PLANNED RUN RESULTS")
+    print(f"{'=' * 70}")
+    print(f"  Initial:    {initial:,}")
+    print(f"  Final:      {initial + engine.total_inserted:,}")
+    print(f"  NEW:        +{stats.inserted:,}")
+    print(f"  Saved:      {stats.redundant:,} redundant searches")
+    print(f"  Time:       {elapsed:.0f}s ({elapsed/60:.1f} min)")
+    print(f"{'=' * 70}")
+
+# ============================================
+# MAIN
+# ============================================
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='VOYO Task Planner')
+    parser.add_argument('--run', action='store_true', help='Run the deduplicated plan')
+    parser.add_argument('workers', type=int, nargs='?', default=8, help='Concurrent search tasks')
+    add_engine_args(parser)
+    args = parser.parse_args()
+
+    if args.run:
+        run_plan(workers=args.workers, **engine_options(args))
+    else:
+        report()
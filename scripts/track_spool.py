@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+VOYO Track Spool - discovery writes to disk, the bulk loader uploads
+=====================================================================
+
+For very large crawls, feeders run with --spool-only: every batch of
+discovered tracks is appended to a local gzip-compressed NDJSON file
+instead of being POSTed to Supabase. scripts/bulk_loader.py later
+dedupes all spooled rows and uploads them in large chunks, so discovery
+and loading scale independently.
+
+- One open file per process (<ns>-<pid>.ndjson.gz.part), flushed after
+  every batch, so a crash loses at most the batch being written
+- Rotated (renamed to .ndjson.gz) every ROTATE_ROWS rows, ROTATE_SECONDS,
+  and at exit; only rotated files are picked up by the loader
+- Parts left by dead processes are rotated by recover()
+
+Usage:
+    spool = TrackSpool()
+    spool.append(rows)
+    spool.close()
+"""
+
+import os
+import gzip
+import json
+import time
+import zlib
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from feeder_state import STATE_DIR
+from upload_spool import _pid_alive
+
+TRACK_SPOOL_DIR = STATE_DIR / 'tracks'
+ROTATE_ROWS = 100_000
+ROTATE_SECONDS = 600.0
+
+class TrackSpool:
+    """Thread-safe append-only writer of rotating .ndjson.gz files"""
+
+    def __init__(self, directory: Path = TRACK_SPOOL_DIR, rotate_rows: int = ROTATE_ROWS,
+                 rotate_seconds: float = ROTATE_SECONDS):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.rotate_rows = rotate_rows
+        self.rotate_seconds = rotate_seconds
+        self.lock = threading.Lock()
+        self.path: Optional[Path] = None
+        self.file: Optional[gzip.GzipFile] = None
+        self.rows = 0
+        self.opened = 0.0
+        self.written = 0
+        self.files = 0
+
+    def _open(self):
+        self.path = self.directory / f'{time.time_ns()}-{os.getpid()}.ndjson.gz.part'
+        self.file = gzip.open(self.path, 'wb', compresslevel=6)
+        self.rows = 0
+        self.opened = time.time()
+
+    def _rotate(self):
+        if self.file is None:
+            return
+        self.file.close()
+        os.replace(self.path, self.path.with_suffix(''))
+        self.files += 1
+        self.file = self.path = None
+
+    def append(self, rows: List[Dict]) -> int:
+        """Write rows (one JSON object per line); returns how many were spooled"""
+        if not rows:
+            return 0
+        data = ''.join(json.dumps(r, separators=(',', ':')) + '\n' for r in rows).encode()
+        with self.lock:
+            if self.file is None:
+                self._open()
+            self.file.write(data)
+            self.file.flush(zlib.Z_SYNC_FLUSH)
+            self.rows += len(rows)
+            self.written += len(rows)
+            if self.rows >= self.rotate_rows or time.time() - self.opened >= self.rotate_seconds:
+                self._rotate()
+        return len(rows)
+
+    def close(self):
+        with self.lock:
+            self._rotate()
+
+    def recover(self) -> int:
+        """Rotate .part files of processes that died before closing them"""
+        recovered = 0
+        for path in self.directory.glob('*.ndjson.gz.part'):
+            try:
+                pid = int(path.name.split('-')[1].split('.')[0])
+            except (IndexError, ValueError):
+                continue
+            if pid == os.getpid() or _pid_alive(pid):
+                continue
+            os.replace(path, path.with_suffix(''))
+            recovered += 1
+        return recovered
+
+def closed_files(directory: Path = TRACK_SPOOL_DIR) -> List[Path]:
+    """Rotated spool files, oldest first"""
+    return sorted(Path(directory).glob('*.ndjson.gz'))
+
+def read_spool(path: Path) -> Iterator[Dict]:
+    """Rows of one spool file; a torn tail from a crash is skipped.
+
+    Decompressed with a raw zlib stream: gzip.read() gives up on a file
+    whose writer died before the end-of-stream marker, zlib returns
+    everything up to the last flushed batch.
+    """
+    decoder = zlib.decompressobj(wbits=31)
+    buffer = b''
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(1 << 20)
+            if not chunk:
+                break
+            try:
+                buffer += decoder.decompress(chunk)
+            except zlib.error:
+                break
+            lines = buffer.split(b'\n')
+            buffer = lines.pop()
+            for line in lines:
+                if line:
+                    yield json.loads(line)
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+VOYO Upload Spool - no discovered batch is ever silently dropped
+=================================================================
+
+Write-ahead spool around Supabase upserts:
+
+- Every batch is written to STATE_DIR/spool before it is sent, and
+  removed once Supabase accepts it
+- Transient failures (timeouts, 429, 5xx) are retried with exponential
+  backoff and full jitter
+- Batches that still fail go to a dead-letter NDJSON file
+- Spool files left by a crashed process are re-sent on the next start
+
+Usage:
+    spool = UploadSpool(send=lambda rows: db.upsert('video_intelligence', rows))
+    spool.recover()
+    synced = spool.submit(rows)
+
+Replay the dead-letter file once Supabase is healthy again:
+    python3 scripts/upload_spool.py replay
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import itertools
+import threading
+import http.client
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from feeder_state import STATE_DIR
+from supabase_client import SupabaseError
+
+SPOOL_DIR = STATE_DIR / 'spool'
+DEAD_LETTER = STATE_DIR / 'dead_letter.ndjson'
+
+RETRY_ATTEMPTS = 6
+BASE_DELAY = 1.0        # seconds, doubled every attempt
+MAX_DELAY = 60.0
+
+RETRY_STATUS = {408, 425, 429}
+
+def is_retryable(error: Exception) -> bool:
+    """Timeouts, dropped connections, 429 and 5xx are worth retrying; 4xx are not"""
+    if isinstance(error, SupabaseError):
+        return error.status in RETRY_STATUS or error.status >= 500
+    return isinstance(error, (OSError, http.client.HTTPException))
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+class UploadSpool:
+    """Durable wrapper around a `send(rows) -> int` upsert function"""
+
+    def __init__(self, send: Callable[[List[Dict]], int], directory: Path = SPOOL_DIR,
+                 dead_letter: Path = DEAD_LETTER, attempts: int = RETRY_ATTEMPTS,
+                 base_delay: float = BASE_DELAY, max_delay: float = MAX_DELAY):
+        self.send = send
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.dead_letter = Path(dead_letter)
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.lock = threading.Lock()
+        self.counter = itertools.count()
+        self.retries = 0
+        self.dead = 0
+
+    # ---------- write-ahead ----------
+
+    def _path(self) -> Path:
+        return self.directory / f'{time.time_ns()}-{os.getpid()}-{next(self.counter)}.json'
+
+    def _write(self, rows: List[Dict]) -> Path:
+        path = self._path()
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(rows, f)
+        os.replace(tmp, path)
+        return path
+
+    def _send_with_retry(self, rows: List[Dict]) -> int:
+        for attempt in range(self.attempts):
+            try:
+                return self.send(rows)
+            except Exception as e:
+                if attempt == self.attempts - 1 or not is_retryable(e):
+                    raise
+                with self.lock:
+                    self.retries += 1
+                time.sleep(random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt)))
+
+    def _bury(self, rows: List[Dict], error: Exception):
+        record = {'failed_at': time.time(), 'error': str(error)[:500], 'rows': rows}
+        with self.lock:
+            self.dead += 1
+            with open(self.dead_letter, 'a') as f:
+                f.write(json.dumps(record) + '\n')
+        print(f"  ☠️  Upsert of {len(rows)} tracks dead-lettered: {str(error)[:120]}")
+
+    def submit(self, rows: List[Dict]) -> int:
+        """Spool, send with retries, dead-letter on failure. Returns rows synced."""
+        if not rows:
+            return 0
+        return self._deliver(rows, self._write(rows))
+
+    def _deliver(self, rows: List[Dict], path: Path) -> int:
+        """Send an already spooled batch; its file goes only once it is synced or buried"""
+        try:
+            return self._send_with_retry(rows)
+        except Exception as e:
+            self._bury(rows, e)
+            return 0
+        finally:
+            path.unlink(missing_ok=True)
+
+    # ---------- recovery ----------
+
+    def recover(self) -> int:
+        """Re-send batches spooled by processes that died mid-upload"""
+        synced = 0
+        for path in sorted(self.directory.glob('*.json')):
+            try:
+                pid = int(path.stem.split('-')[1])
+            except (IndexError, ValueError):
+                continue
+            if pid != os.getpid() and _pid_alive(pid):
+                continue  # another feeder is still working on it
+            try:
+                rows = json.loads(path.read_text())
+            except (OSError, json.JSONDecodeError):
+                path.unlink(missing_ok=True)
+                continue
+            # Claim it under our pid by renaming: the batch stays on disk until it is
+            # sent, so a crash during recovery is recovered again
+            claimed = self._path()
+            try:
+                os.replace(path, claimed)
+            except FileNotFoundError:
+                continue  # another recovering feeder claimed it first
+            synced += self._deliver(rows, claimed)
+        if synced:
+            print(f"  ♻️  Recovered {synced:,} spooled tracks from an interrupted run")
+        return synced
+
+    def replay_dead_letters(self) -> Tuple[int, int]:
+        """Re-submit every dead-lettered batch; failures are dead-lettered again.
+
+        A .replaying file left by an interrupted replay still holds batches
+        that were never re-sent: the current dead letters are appended to it
+        and the whole file is replayed, never overwritten.
+        """
+        replaying = self.dead_letter.with_suffix('.replaying')
+        # Take the dead letters under our own name first, so a feeder burying
+        # a batch meanwhile starts a new file instead of writing into ours
+        taken = self.dead_letter.with_suffix(f'.{os.getpid()}')
+        try:
+            os.replace(self.dead_letter, taken)
+        except FileNotFoundError:
+            pass
+        # ...plus any a replay that died right after taking them left behind
+        for path in sorted(self.dead_letter.parent.glob(f'{self.dead_letter.stem}.[0-9]*')):
+            pid = path.suffix[1:]
+            if not pid.isdigit() or (int(pid) != os.getpid() and _pid_alive(int(pid))):
+                continue
+            with open(path) as src, open(replaying, 'a') as dst:
+                dst.writelines(src)
+                dst.flush()
+                os.fsync(dst.fileno())
+            path.unlink()
+        if not replaying.exists():
+            return 0, 0
+        ok = failed = 0
+        with open(replaying) as f:
+            for line in f:
+                try:
+                    rows = json.loads(line)['rows']
+                except (json.JSONDecodeError, KeyError):
+                    continue
+                if self.submit(rows):
+                    ok += len(rows)
+                else:
+                    failed += len(rows)
+        replaying.unlink()
+        return ok, failed
+
+    def summary(self) -> Dict[str, int]:
+        return {'retries': self.retries, 'dead_lettered': self.dead,
+                'pending': sum(1 for _ in self.directory.glob('*.json'))}
+
+# ============================================
+# MAIN
+# ============================================
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or sys.argv[1] not in ('replay', 'status'):
+        print("Usage: python3 upload_spool.py replay | status")
+        sys.exit(1)
+
+    from feeder_engine import spool
+
+    s = spool()
+    if sys.argv[1] == 'replay':
+        ok, failed = s.replay_dead_letters()
+        print(f"✅ Replayed {ok:,} tracks, {failed:,} still failing")
+    else:
+        dead = sum(1 for _ in open(DEAD_LETTER)) if DEAD_LETTER.exists() else 0
+        print(f"Spool: {s.summary()['pending']} pending batches | Dead letters: {dead} batches")
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+VOYO Work Key - one song, one key, however many uploads
+========================================================
+
+The same song reaches the catalog as official video, audio, lyric video,
+"- Topic" upload and fan re-uploads, each under its own videoId. A work
+key reduces title + artist to the underlying work:
+
+- "Artist - Song" titles split, channel noise (" - Topic", VEVO) dropped
+- Title suffixes stripped with the lyrics_dynamic rules: (Official ...),
+  (Audio), (Lyric ...), [...], "| ...", ft./feat.
+- Versions that are different recordings (live, remix, cover, acoustic...)
+  keep their canonizer_v4.detect_content_type as part of the key
+
+WorkIndex remembers the first videoId seen for every key (the canonical
+track); later uploads of the same work are linked to it at ingest. A new
+index is seeded from the catalog first (feeder_engine.open_work_index),
+so songs already in Supabase stay canonical.
+
+Usage:
+    key = work_key("Burna Boy - Last Last (Official Music Video)", "Burna Boy VEVO")
+    index = WorkIndex()
+    canonical = index.link_many([(key, video_id)])[0]
+"""
+
+import re
+import sqlite3
+import threading
+import unicodedata
+from pathlib import Path
+from typing import List, Tuple
+
+from feeder_state import STATE_DIR
+from canonizer_v4 import detect_content_type
+
+INDEX_PATH = STATE_DIR / 'work_index.sqlite'
+
+# ============================================
+# TITLE CLEANING (shared with lyrics_dynamic)
+# ============================================
+
+SONG_SUFFIXES = [
+    (re.compile(r'\s*\(Official.*?\)', re.I), ''),
+    (re.compile(r'\s*\(Audio.*?\)', re.I), ''),
+    (re.compile(r'\s*\(Lyric.*?\)', re.I), ''),
+    (re.compile(r'\s*\[.*?\]'), ''),
+    (re.compile(r'\s*\|.*$'), ''),
+    (re.compile(r'\s*ft\..*$', re.I), ''),
+    (re.compile(r'\s*feat\..*$', re.I), ''),
+]
+
+def clean_channel(author: str) -> str:
+    return author.replace(' - Topic', '').replace('VEVO', '').strip()
+
+def clean_song(song: str) -> str:
+    """Strip upload decorations: (Official Video), [Lyrics], | label, ft. ..."""
+    for pattern, repl in SONG_SUFFIXES:
+        song = pattern.sub(repl, song)
+    return song.strip()
+
+def split_title(title: str, author: str = '') -> Tuple[str, str]:
+    """'Artist - Song' titles -> (artist, song); otherwise the channel is the artist"""
+    if ' - ' in title:
+        artist, song = title.split(' - ', 1)
+    else:
+        artist, song = clean_channel(author), title
+    return artist.strip(), clean_song(song)
+
+# ============================================
+# WORK KEY
+# ============================================
+
+_FEATURING = re.compile(r'\s*(?:,|&|\bx\b|\bfeat\.?|\bft\.?|\bwith\b).*$', re.I)
+_VERSION = re.compile(r'\s*[(\[][^)\]]*[)\]]')
+
+def _norm(text: str) -> str:
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(c for c in text if not unicodedata.combining(c)).lower()
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', text).split())
+
+def work_key(title: str, artist: str = '') -> str:
+    """'primary artist|song[|version]' for near-duplicate detection"""
+    split_artist, song = split_title(title or '', artist or '')
+    primary = _FEATURING.sub('', clean_channel(split_artist or artist or '')) or split_artist
+    # Classify the title only: "| Afrobeats" tails and artist names trip its keyword match
+    content_type = detect_content_type(re.sub(r'\s*\|.*$', '', title or ''), '')
+    # Remaining brackets are version info ("(Remix)", "(Live)"): carried by content_type
+    song = _VERSION.sub('', song)
+    key = f'{_norm(primary)}|{_norm(song)}'
+    return key if content_type == 'original' else f'{key}|{content_type}'
+
+# ============================================
+# WORK INDEX
+# ============================================
+
+class WorkIndex:
+    """Persistent work key -> canonical youtube_id (first upload seen wins)"""
+
+    def __init__(self, path: Path = INDEX_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.execute('''CREATE TABLE IF NOT EXISTS works (
+            key TEXT PRIMARY KEY,
+            canonical_id TEXT NOT NULL
+        )''')
+        self.db.execute('''CREATE TABLE IF NOT EXISTS meta (
+            name TEXT PRIMARY KEY,
+            value TEXT
+        )''')
+
+    def link_many(self, pairs: List[Tuple[str, str]]) -> List[str]:
+        """Register (key, youtube_id) pairs; returns each one's canonical youtube_id"""
+        with self.lock:
+            self.db.execute('BEGIN')
+            try:
+                self.db.executemany('INSERT OR IGNORE INTO works VALUES (?, ?)', pairs)
+                canonical = [self.db.execute('SELECT canonical_id FROM works WHERE key = ?',
+                                             (key,)).fetchone()[0] for key, _ in pairs]
+                self.db.execute('COMMIT')
+            except BaseException:
+                self.db.execute('ROLLBACK')
+                raise
+        return canonical
+
+    @property
+    def seeded(self) -> bool:
+        """Whether the catalog's tracks were registered (mark_seeded)"""
+        with self.lock:
+            return self.db.execute("SELECT 1 FROM meta WHERE name = 'seeded'").fetchone() is not None
+
+    def mark_seeded(self, when: str):
+        with self.lock:
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('seeded', ?)", (when,))
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.db.execute('SELECT COUNT(*) FROM works').fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.db.close()
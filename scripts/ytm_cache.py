@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+VOYO YTMusic Response Cache - never pay twice for the same search
+==================================================================
+
+Disk-backed cache for ytm.search / get_artist / get_album responses,
+keyed by (method, query, filter, limit). The same artists appear in
+every feeder's lists, so repeat runs only spend API calls on queries
+that aren't cached yet.
+
+- SQLite file under STATE_DIR, values are zlib-compressed JSON
+- Per-method TTL (albums barely change, searches do)
+- LRU bound on total compressed size
+
+Usage:
+    cache = ResponseCache()
+    results = cache.call(ytm, 'search', 'Burna Boy', filter='songs', limit=30)
+"""
+
+import json
+import time
+import zlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from feeder_state import STATE_DIR
+
+CACHE_PATH = STATE_DIR / 'ytm_cache.sqlite'
+
+HOUR = 3600
+DEFAULT_TTLS = {
+    'search': 72 * HOUR,
+    'get_artist': 7 * 24 * HOUR,
+    'get_album': 30 * 24 * HOUR,
+}
+DEFAULT_MAX_MB = 512
+EVICT_EVERY = 500       # puts between size checks
+
+class ResponseCache:
+    def __init__(self, path: Path = CACHE_PATH, ttls: Optional[Dict[str, float]] = None,
+                 max_mb: float = DEFAULT_MAX_MB):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.puts = 0
+        # Autocommit: several feeders share this file, never hold a write lock
+        self.db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.execute('''CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            value BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            created REAL NOT NULL,
+            accessed REAL NOT NULL
+        )''')
+        self.db.execute('CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed)')
+
+    @staticmethod
+    def key(method: str, args: Tuple, kwargs: Dict) -> str:
+        return json.dumps([method, list(args), sorted(kwargs.items())], ensure_ascii=False)
+
+    def cacheable(self, method: str) -> bool:
+        return method in self.ttls
+
+    def get(self, method: str, args: Tuple = (), kwargs: Optional[Dict] = None) -> Tuple[bool, Any]:
+        """(hit, value). Expired entries count as misses."""
+        if not self.cacheable(method):
+            return False, None
+        key = self.key(method, args, kwargs or {})
+        now = time.time()
+        with self.lock:
+            row = self.db.execute('SELECT value, created FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None or now - row[1] > self.ttls[method]:
+                self.misses += 1
+                return False, None
+            self.db.execute('UPDATE responses SET accessed = ? WHERE key = ?', (now, key))
+            self.hits += 1
+        return True, json.loads(zlib.decompress(row[0]))
+
+    def put(self, method: str, args: Tuple, kwargs: Optional[Dict], value: Any):
+        if not self.cacheable(method):
+            return
+        key = self.key(method, args, kwargs or {})
+        blob = zlib.compress(json.dumps(value, ensure_ascii=False, default=str).encode(), 6)
+        now = time.time()
+        with self.lock:
+            self.db.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)',
+                            (key, blob, len(blob), now, now))
+            self.puts += 1
+            if self.puts % EVICT_EVERY == 0:
+                self._evict()
+
+    def _evict(self):
+        """Drop expired entries, then least-recently-used ones until under max size"""
+        now = time.time()
+        for method, ttl in self.ttls.items():
+            self.db.execute('DELETE FROM responses WHERE created < ? AND key LIKE ?',
+                            (now - ttl, json.dumps([method])[:-1] + ',%'))
+        total = self.db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - int(self.max_bytes * 0.9)
+        freed = 0
+        doomed = []
+        for key, size in self.db.execute('SELECT key, size FROM responses ORDER BY accessed'):
+            doomed.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self.db.executemany('DELETE FROM responses WHERE key = ?', doomed)
+
+    def call(self, ytm, method: str, *args, **kwargs) -> Any:
+        """Synchronous read-through: cached value or ytm.<method>(*args, **kwargs)"""
+        hit, value = self.get(method, args, kwargs)
+        if hit:
+            return value
+        value = getattr(ytm, method)(*args, **kwargs)
+        self.put(method, args, kwargs, value)
+        return value
+
+    def close(self):
+        with self.lock:
+            self.db.close()
@@ -0,0 +1,45 @@
+-- ============================================
+-- VOYO FEEDER INGEST - Inserted vs merged accounting
+-- ============================================
+-- Feeders used to measure progress with count=exact before and after
+-- every round (a full scan of video_intelligence). ingest_tracks upserts
+-- a batch and reports how many rows were brand new and how many merged
+-- into existing ones, so feeders can keep exact totals locally.
+
+-- ============================================
+-- BATCH UPSERT WITH ACCOUNTING
+-- ============================================
+-- xmax = 0 on the returned row means no previous row version was
+-- replaced, i.e. the row was inserted rather than updated.
+CREATE OR REPLACE FUNCTION ingest_tracks(tracks JSONB)
+RETURNS TABLE (
+  inserted INTEGER,
+  updated INTEGER
+) AS $$
+BEGIN
+  RETURN QUERY
+  WITH upserted AS (
+    INSERT INTO video_intelligence (youtube_id, title, artist, thumbnail_url)
+    SELECT DISTINCT ON (t.youtube_id)
+      t.youtube_id, t.title, t.artist, t.thumbnail_url
+    FROM jsonb_to_recordset(tracks) AS t(
+      youtube_id TEXT,
+      title TEXT,
+      artist TEXT,
+      thumbnail_url TEXT
+    )
+    WHERE t.youtube_id IS NOT NULL
+    ON CONFLICT (youtube_id) DO UPDATE SET
+      title = EXCLUDED.title,
+      artist = EXCLUDED.artist,
+      thumbnail_url = EXCLUDED.thumbnail_url
+    RETURNING (xmax = 0) AS is_insert
+  )
+  SELECT
+    (COUNT(*) FILTER (WHERE is_insert))::INTEGER,
+    (COUNT(*) FILTER (WHERE NOT is_insert))::INTEGER
+  FROM upserted;
+END;
+$$ LANGUAGE plpgsql;
+
+GRANT EXECUTE ON FUNCTION ingest_tracks(JSONB) TO anon, authenticated;
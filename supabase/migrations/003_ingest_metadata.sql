@@ -0,0 +1,61 @@
+-- ============================================
+-- VOYO FEEDER INGEST - Metadata captured at ingest
+-- ============================================
+-- YTMusic search results already carry duration, views, album and year.
+-- The feeders now keep them, so the canonizer no longer has to recover
+-- popularity one video at a time from the YouTube Data API.
+
+ALTER TABLE video_intelligence ADD COLUMN IF NOT EXISTS view_count BIGINT;
+ALTER TABLE video_intelligence ADD COLUMN IF NOT EXISTS album TEXT;
+ALTER TABLE video_intelligence ADD COLUMN IF NOT EXISTS year INTEGER;
+
+CREATE INDEX IF NOT EXISTS idx_video_views
+  ON video_intelligence(view_count DESC NULLS LAST);
+
+-- ============================================
+-- BATCH UPSERT WITH ACCOUNTING (replaces 002)
+-- ============================================
+-- Metadata a batch doesn't have (NULL) never overwrites stored values;
+-- view counts only move forward.
+CREATE OR REPLACE FUNCTION ingest_tracks(tracks JSONB)
+RETURNS TABLE (
+  inserted INTEGER,
+  updated INTEGER
+) AS $$
+BEGIN
+  RETURN QUERY
+  WITH upserted AS (
+    INSERT INTO video_intelligence (
+      youtube_id, title, artist, thumbnail_url,
+      duration_seconds, view_count, album, year
+    )
+    SELECT DISTINCT ON (t.youtube_id)
+      t.youtube_id, t.title, t.artist, t.thumbnail_url,
+      t.duration_seconds, t.view_count, t.album, t.year
+    FROM jsonb_to_recordset(tracks) AS t(
+      youtube_id TEXT,
+      title TEXT,
+      artist TEXT,
+      thumbnail_url TEXT,
+      duration_seconds INTEGER,
+      view_count BIGINT,
+      album TEXT,
+      year INTEGER
+    )
+    WHERE t.youtube_id IS NOT NULL
+    ON CONFLICT (youtube_id) DO UPDATE SET
+      title = EXCLUDED.title,
+      artist = EXCLUDED.artist,
+      thumbnail_url = EXCLUDED.thumbnail_url,
+      duration_seconds = COALESCE(EXCLUDED.duration_seconds, video_intelligence.duration_seconds),
+      view_count = GREATEST(EXCLUDED.view_count, video_intelligence.view_count),
+      album = COALESCE(EXCLUDED.album, video_intelligence.album),
+      year = COALESCE(EXCLUDED.year, video_intelligence.year)
+    RETURNING (xmax = 0) AS is_insert
+  )
+  SELECT
+    (COUNT(*) FILTER (WHERE is_insert))::INTEGER,
+    (COUNT(*) FILTER (WHERE NOT is_insert))::INTEGER
+  FROM upserted;
+END;
+$$ LANGUAGE plpgsql;
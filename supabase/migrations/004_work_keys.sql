@@ -0,0 +1,66 @@
+-- ============================================
+-- VOYO FEEDER INGEST - Work keys for re-uploads
+-- ============================================
+-- The same song arrives as official video, audio, lyric video and fan
+-- re-uploads. Feeders tag every track with a normalized work key
+-- (scripts/work_key.py) and, when an earlier upload of the same work is
+-- known, the canonical youtube_id it duplicates.
+
+ALTER TABLE video_intelligence ADD COLUMN IF NOT EXISTS work_key TEXT;
+ALTER TABLE video_intelligence ADD COLUMN IF NOT EXISTS canonical_id TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_video_work_key
+  ON video_intelligence(work_key);
+
+-- ============================================
+-- BATCH UPSERT WITH ACCOUNTING (replaces 003)
+-- ============================================
+-- A row keeps the work key and canonical track it was first linked to.
+CREATE OR REPLACE FUNCTION ingest_tracks(tracks JSONB)
+RETURNS TABLE (
+  inserted INTEGER,
+  updated INTEGER
+) AS $$
+BEGIN
+  RETURN QUERY
+  WITH upserted AS (
+    INSERT INTO video_intelligence (
+      youtube_id, title, artist, thumbnail_url,
+      duration_seconds, view_count, album, year,
+      work_key, canonical_id
+    )
+    SELECT DISTINCT ON (t.youtube_id)
+      t.youtube_id, t.title, t.artist, t.thumbnail_url,
+      t.duration_seconds, t.view_count, t.album, t.year,
+      t.work_key, t.canonical_id
+    FROM jsonb_to_recordset(tracks) AS t(
+      youtube_id TEXT,
+      title TEXT,
+      artist TEXT,
+      thumbnail_url TEXT,
+      duration_seconds INTEGER,
+      view_count BIGINT,
+      album TEXT,
+      year INTEGER,
+      work_key TEXT,
+      canonical_id TEXT
+    )
+    WHERE t.youtube_id IS NOT NULL
+    ON CONFLICT (youtube_id) DO UPDATE SET
+      title = EXCLUDED.title,
+      artist = EXCLUDED.artist,
+      thumbnail_url = EXCLUDED.thumbnail_url,
+      duration_seconds = COALESCE(EXCLUDED.duration_seconds, video_intelligence.duration_seconds),
+      view_count = GREATEST(EXCLUDED.view_count, video_intelligence.view_count),
+      album = COALESCE(EXCLUDED.album, video_intelligence.album),
+      year = COALESCE(EXCLUDED.year, video_intelligence.year),
+      work_key = COALESCE(video_intelligence.work_key, EXCLUDED.work_key),
+      canonical_id = COALESCE(video_intelligence.canonical_id, EXCLUDED.canonical_id)
+    RETURNING (xmax = 0) AS is_insert
+  )
+  SELECT
+    (COUNT(*) FILTER (WHERE is_insert))::INTEGER,
+    (COUNT(*) FILTER (WHERE NOT is_insert))::INTEGER
+  FROM upserted;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,68 @@
+-- ============================================
+-- VOYO FEEDER INGEST - Non-music tagging
+-- ============================================
+-- Feeders screen discovered videos by title and duration
+-- (scripts/content_filter.py). Interviews, reactions, podcasts and
+-- hour-long compilations are dropped by default; with --keep-non-music
+-- they are uploaded with the reason in non_music, and the canonizer and
+-- lyrics batch skip them.
+
+ALTER TABLE video_intelligence ADD COLUMN IF NOT EXISTS non_music TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_video_music
+  ON video_intelligence(youtube_id) WHERE non_music IS NULL;
+
+-- ============================================
+-- BATCH UPSERT WITH ACCOUNTING (replaces 004)
+-- ============================================
+-- The latest screen wins: a re-discovered track is re-tagged or cleared.
+CREATE OR REPLACE FUNCTION ingest_tracks(tracks JSONB)
+RETURNS TABLE (
+  inserted INTEGER,
+  updated INTEGER
+) AS $$
+BEGIN
+  RETURN QUERY
+  WITH upserted AS (
+    INSERT INTO video_intelligence (
+      youtube_id, title, artist, thumbnail_url,
+      duration_seconds, view_count, album, year,
+      work_key, canonical_id, non_music
+    )
+    SELECT DISTINCT ON (t.youtube_id)
+      t.youtube_id, t.title, t.artist, t.thumbnail_url,
+      t.duration_seconds, t.view_count, t.album, t.year,
+      t.work_key, t.canonical_id, t.non_music
+    FROM jsonb_to_recordset(tracks) AS t(
+      youtube_id TEXT,
+      title TEXT,
+      artist TEXT,
+      thumbnail_url TEXT,
+      duration_seconds INTEGER,
+      view_count BIGINT,
+      album TEXT,
+      year INTEGER,
+      work_key TEXT,
+      canonical_id TEXT,
+      non_music TEXT
+    )
+    WHERE t.youtube_id IS NOT NULL
+    ON CONFLICT (youtube_id) DO UPDATE SET
+      title = EXCLUDED.title,
+      artist = EXCLUDED.artist,
+      thumbnail_url = EXCLUDED.thumbnail_url,
+      duration_seconds = COALESCE(EXCLUDED.duration_seconds, video_intelligence.duration_seconds),
+      view_count = GREATEST(EXCLUDED.view_count, video_intelligence.view_count),
+      album = COALESCE(EXCLUDED.album, video_intelligence.album),
+      year = COALESCE(EXCLUDED.year, video_intelligence.year),
+      work_key = COALESCE(video_intelligence.work_key, EXCLUDED.work_key),
+      canonical_id = COALESCE(video_intelligence.canonical_id, EXCLUDED.canonical_id),
+      non_music = EXCLUDED.non_music
+    RETURNING (xmax = 0) AS is_insert
+  )
+  SELECT
+    (COUNT(*) FILTER (WHERE is_insert))::INTEGER,
+    (COUNT(*) FILTER (WHERE NOT is_insert))::INTEGER
+  FROM upserted;
+END;
+$$ LANGUAGE plpgsql;